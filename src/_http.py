@@ -0,0 +1,34 @@
+"""
+    One HTTP session shared by every module that talks to Yahoo
+
+    Why share a session:
+        each bare yf.download builds a fresh requests.Session, which
+        means a new TCP + TLS handshake (~100ms) per call. A shared
+        session keeps the connection pooled and reuses it.
+
+    Two tiers, depending on what's installed:
+        requests_cache available -> CachedSession: pooled connections
+            AND identical responses remembered on disk for a day, so
+            repeated runs never refetch the same bytes
+        otherwise -> plain requests.Session with a widened connection
+            pool (32 sockets), enough for a full universe of parallel
+            ticker requests
+
+    SESSION can also be None (requests missing entirely) — yfinance
+    then just manages its own connections like before.
+"""
+
+try:
+    import requests_cache
+    SESSION = requests_cache.CachedSession(".cache/yf_http", backend="sqlite", expire_after=86400)
+except Exception:
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        SESSION = requests.Session()
+        _adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=3)
+        SESSION.mount("https://", _adapter)
+        SESSION.mount("http://", _adapter)
+    except Exception:
+        SESSION = None
@@ -0,0 +1,31 @@
+"""
+    Optional Numba support
+
+    Numba compiles plain Python loops to machine code (huge speedup for
+    the indicator kernels), but it is NOT one of our required packages.
+
+    So:
+        numba installed     -> njit is the real numba.njit
+        numba not installed -> njit does nothing, the loops just run
+                               as normal Python (slower, same answers)
+
+    Import it like:
+        from src._njit import njit
+"""
+
+try:
+    from numba import njit  # noqa: F401
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """
+            Stand-in decorator — supports both @njit and @njit(cache=True)
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
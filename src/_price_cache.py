@@ -0,0 +1,84 @@
+"""
+    Small on-disk cache for downloaded price data
+
+    Problem:
+        every backtest re-run downloads the SAME historical windows again
+        (the past does not change!) — that is what makes re-runs slow
+        and also what gets us rate-limited by Yahoo
+
+    Fix:
+        after the first download, save the DataFrame as a Parquet file
+        under .cache/prices/ — next run loads it from disk in milliseconds
+
+    Each window gets its own file, named by an md5 hash of
+    (ticker, start, end) so the filename is always filesystem-safe.
+
+    Files older than TTL_DAYS are treated as stale and re-downloaded
+    (cheap safety net in case adjusted prices get restated).
+"""
+
+import hashlib
+import os
+import time
+
+import pandas as pd
+
+# pandas needs pyarrow to read/write parquet — if it is not installed
+# the cache silently turns itself off and everything still works
+try:
+    import pyarrow  # noqa: F401
+    _HAS_PARQUET = True
+except ImportError:
+    _HAS_PARQUET = False
+
+CACHE_DIR = os.path.join(".cache", "prices")
+TTL_DAYS = 30
+
+
+def make_key(ticker: str, start: str, end: str) -> str:
+    """
+        Build the cache filename stem for one price window
+
+        Example:
+            make_key("RELIANCE.NS", "2024-01-15", "2024-02-14")
+            -> "3e2a9c..." (32 hex chars, same inputs = same key)
+    """
+    raw = f"{ticker}|{start}|{end}"
+    return hashlib.md5(raw.encode()).hexdigest()
+
+
+def load(key: str, ttl_days: int = TTL_DAYS) -> pd.DataFrame:
+    """
+        Return the cached DataFrame for key, or None on a miss
+
+        A miss means: no file, file too old, or file unreadable
+    """
+    if not _HAS_PARQUET:
+        return None
+
+    path = os.path.join(CACHE_DIR, key + ".parquet")
+    if not os.path.exists(path):
+        return None
+
+    age_days = (time.time() - os.path.getmtime(path)) / 86400
+    if age_days > ttl_days:
+        return None
+
+    try:
+        return pd.read_parquet(path)
+    except Exception:
+        return None
+
+
+def store(key: str, df: pd.DataFrame) -> None:
+    """
+        Save one price window to disk (no-op if there is nothing to save)
+    """
+    if not _HAS_PARQUET or df is None or df.empty:
+        return
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    try:
+        df.to_parquet(os.path.join(CACHE_DIR, key + ".parquet"))
+    except Exception:
+        pass
@@ -23,13 +23,16 @@
 """
 
 import logging
+import os
 import sys
 import warnings
 warnings.filterwarnings("ignore", category=FutureWarning)
 
 import numpy as np
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 # use this to move month-by-month (timedelta(days=30) is wrong because months have different lengths)
 # use timedelta for holding days (exact days)
@@ -38,6 +41,8 @@ from dateutil.relativedelta import relativedelta
 
 import yfinance as yf
 
+from src import _price_cache as price_cache
+from src.backtest_engine import calculate_max_drawdown
 from src.screener  import StockScreener
 from src.stock_list import get_stock_list
 
@@ -49,6 +54,47 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# one pooled (and, with requests_cache, disk-cached) HTTP session for
+# every Yahoo call — shared with the screener and walk-forward, see _http.py
+from src._http import SESSION as _SESSION
+
+# pyarrow's CSV writer is C++ — pandas.to_csv goes row by row in Python
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+
+def _write_csv(df: pd.DataFrame, path: str) -> None:
+    """
+        Write one result frame as CSV — arrow writer when available,
+        plain to_csv otherwise. Same file either way, so everything that
+        reads these CSVs keeps working unchanged.
+    """
+    if pa is not None and not df.empty:
+        pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+    else:
+        df.to_csv(path, index=False)
+
+
+@lru_cache(maxsize=256)
+def _download_nifty(start_str: str, end_str: str) -> pd.DataFrame:
+    """
+        Download one ^NSEI window, remembered for the whole session
+
+        Benchmark windows get asked for repeatedly (re-runs, walk-forward
+        style sweeps over overlapping months), so lru_cache hands back the
+        same frame instead of hitting Yahoo again. maxsize is bounded so a
+        long session can't grow memory without limit.
+    """
+    df = yf.download("^NSEI",start=start_str,end=end_str,progress=False,auto_adjust=True,session=_SESSION)
+    # single-ticker download still comes back with (field, ticker)
+    # column levels — flatten once at the boundary
+    if isinstance(df.columns, pd.MultiIndex):
+        df.columns = df.columns.get_level_values(0)
+    return df
+
 
 class Backtest:
     def __init__(self,backtest_months: int = 12,lookback_days: int = 400,top_n: int = 3,holding_days: int = 30,start_year: int = 2024,start_month: int = 1):
@@ -70,6 +116,8 @@ class Backtest:
         self.stock_list = get_stock_list()
         self.monthly_results = []
         self.all_picks = []
+        self.universe_data = {} # full-span frames, filled by preload_universe()
+        self.universe_span = None # (start, end) the frames actually cover
 
         logger.info("─"*71)
         logger.info("BACKTEST INFO".center(69))
@@ -80,13 +128,147 @@ class Backtest:
         logger.info(" Start       :   %d-%02d".center(67), start_year, start_month)
         logger.info("─"*71 + "\n")
 
+    def download_universe(self, tickers: list, start: datetime, end: datetime) -> dict:
+        """
+            Download many tickers in ONE yf.download call
+
+            Before: one HTTP request per ticker (15 tickers = 15 round trips)
+            Now:    yfinance accepts a list and batches everything server-side,
+                    so the whole universe comes back in a single request
+
+            Returns dict of {ticker: DataFrame} — same shape screener.data uses
+
+            Each window is also cached on disk (see _price_cache), so a re-run
+            of the backtest only downloads tickers it has never seen before
+        """
+        data = {}
+        start_str = start.strftime("%Y-%m-%d")
+        end_str = end.strftime("%Y-%m-%d")
+
+        missing = []
+        for ticker in tickers:
+            cached = price_cache.load(price_cache.make_key(ticker, start_str, end_str))
+            if cached is not None:
+                data[ticker] = cached
+            else:
+                missing.append(ticker)
+
+        if not missing:
+            return data
+
+        try:
+            df = yf.download(missing,start=start_str,end=end_str,group_by="ticker",threads=True,progress=False,auto_adjust=True,session=_SESSION)
+        except Exception as exc:
+            logger.warning("  Batch download failed: %s".center(69), exc)
+            return data
+
+        if df is None or df.empty:
+            return data
+
+        for ticker in missing:
+            try:
+                # multi-ticker result has (ticker, field) column levels
+                sub = df[ticker] if isinstance(df.columns, pd.MultiIndex) else df
+            except KeyError:
+                continue
+
+            # flatten any leftover column levels HERE, once, so nothing
+            # downstream ever has to isinstance-check Series vs DataFrame
+            if isinstance(sub.columns, pd.MultiIndex):
+                sub.columns = sub.columns.get_level_values(0)
+
+            sub = sub.dropna(how="all")
+            if not sub.empty:
+                data[ticker] = sub
+                price_cache.store(price_cache.make_key(ticker, start_str, end_str), sub)
+
+        return data
+
+    def preload_universe(self, start: datetime) -> None:
+        """
+            Download the WHOLE backtest span once, up front
+
+            Consecutive months share ~95% of their lookback window (it only
+            shifts by ~30 days), so downloading a fresh window every month
+            re-fetches almost all the same bytes 12 times over.
+
+            Instead: one batched download covering
+                [first screen date - lookback ... last exit date]
+            for every ticker plus the Nifty benchmark. The monthly loop then
+            just slices this in memory — zero network per month.
+        """
+        global_start = start - timedelta(days=self.lookback_days)
+        last_screen = start + relativedelta(months=self.backtest_months - 1)
+        global_end = last_screen + timedelta(days=self.holding_days + 1)
+
+        logger.info("Preloading %d tickers  %s → %s".center(69),len(self.stock_list) + 1,global_start.strftime("%Y-%m-%d"),global_end.strftime("%Y-%m-%d"))
+
+        self.universe_data = self.download_universe(list(self.stock_list) + ["^NSEI"], global_start, global_end)
+        self.universe_span = (global_start, global_end) if self.universe_data else None
+
+        logger.info("Preloaded %d / %d tickers\n".center(70),len(self.universe_data), len(self.stock_list) + 1)
+
+    @staticmethod
+    def slice_window(df: pd.DataFrame, start: datetime, end: datetime) -> pd.DataFrame:
+        """
+            Rows with start <= date < end (end stays exclusive, exactly like
+            passing start/end to yf.download — no future data leaks in)
+        """
+        s = pd.Timestamp(start)
+        e = pd.Timestamp(end)
+        if df.index.tz is not None:
+            s = s.tz_localize(df.index.tz)
+            e = e.tz_localize(df.index.tz)
+        return df[(df.index >= s) & (df.index < e)]
+
+    def _covers(self, start: datetime, end: datetime) -> bool:
+        """
+            True when the cached universe was downloaded for a span that
+            contains [start, end]
+
+            Checking only "is universe_data non-empty" is not enough: a
+            window cached for one month silently hands back truncated or
+            empty slices for any other month. The recorded span makes
+            the cache self-describing, so callers re-download instead of
+            slicing data that was never fetched.
+        """
+        if not self.universe_data or self.universe_span is None:
+            return False
+        span_start, span_end = self.universe_span
+        return span_start <= start and end <= span_end
+
     def screen_on_date(self, screen_date: datetime) -> list:
         text = f"Using screener on {screen_date.strftime('%Y-%m-%d')}"
         logger.info("│" + text.center(69) + "│")
         logger.info("─"*71 + "\n")
 
         screener = StockScreener(tickers=self.stock_list,lookback_days=self.lookback_days,screen_date=screen_date)
-        screener.download_data(max_workers=6)
+        lookback_start = screen_date - timedelta(days=self.lookback_days)
+
+        month_end = screen_date + timedelta(days=self.holding_days + 1)
+        if not self._covers(lookback_start, month_end):
+            """
+                No preload covering this month (screen_on_date called
+                outside run(), a different month than last time, or a
+                failed preload): still make only ONE request — blind
+                window and holding window together, kept on self with
+                its span so measure_returns and the benchmark slice the
+                same frames instead of downloading again
+            """
+            self.universe_data = self.download_universe(list(self.stock_list) + ["^NSEI"], lookback_start, month_end)
+            self.universe_span = (lookback_start, month_end) if self.universe_data else None
+            logger.info("Downloaded %d / %d tickers (combined window)\n".center(70),len(self.universe_data), len(self.stock_list) + 1)
+
+        # blind window sliced in memory — end-exclusive at the screen date,
+        # so no future rows reach the screener
+        for ticker in self.stock_list:
+            df = self.universe_data.get(ticker)
+            if df is None:
+                continue
+            window = self.slice_window(df, lookback_start, screen_date)
+            if not window.empty:
+                screener.data[ticker] = window
+        logger.info("Sliced %d / %d Stocks from preloaded data\n".center(70),len(screener.data), len(self.stock_list))
         screener.calculate_indicators()
         screener.generate_signals()
 
@@ -95,17 +277,14 @@ class Backtest:
                            screen_date.strftime("%b %Y"))
             return []
 
-        top = screener.results.head(self.top_n)
-        picks = [(row["Ticker"], row["Combined_Score"], row["Price"])for _, row in top.iterrows()]
+        top = screener.top_picks(self.top_n) # O(N) selection, no full sort / iterrows
+        picks = [(ticker, score, price) for ticker, score, price, _ in top]
 
         logger.info("─"*71)
         logger.info("│" + "TOP PICKS".center(69) + "│")
         logger.info("─"*71)
 
-        for _ , row in top.iterrows():
-            ticker = row["Ticker"]
-            label  = row["Signal"]
-
+        for ticker, _, _, label in top:
             line = f"{ticker:<15} - {label:>12}"
             logger.info("│" + line.center(69) + "│")
 
@@ -118,25 +297,35 @@ class Backtest:
         exit_date = screen_date + timedelta(days=self.holding_days)
         trades = []
 
+        # holding windows come from the preloaded span when it actually
+        # covers them, otherwise one batched call — returns computed in
+        # pick order below
+        if self._covers(screen_date, exit_date):
+            forward = {}
+            for ticker, _, _ in picks:
+                df = self.universe_data.get(ticker)
+                if df is not None:
+                    forward[ticker] = self.slice_window(df, screen_date, exit_date)
+        else:
+            forward = self.download_universe([ticker for ticker, _, _ in picks], screen_date, exit_date)
+
         logger.info("│"+ "TRADES".center(69) +"│")
         logger.info("─"*71)
         for ticker, score, entry_price in picks:
             try:
-                df = yf.download(ticker,start=screen_date.strftime("%Y-%m-%d"),end=exit_date.strftime("%Y-%m-%d"),progress=False,auto_adjust=True)
-                if len(df) < 2:
+                df = forward.get(ticker)
+                if df is None or len(df) < 2:
                     logger.warning("  %s: not enough forward data", ticker)
                     continue
 
-                close = df["Close"]
-                if isinstance(close, pd.DataFrame):
-                    close = close.iloc[:, 0]
-                    
-                close = close.dropna()
+                # columns were flattened at download time — straight to NumPy
+                close = df["Close"].dropna().to_numpy()
                 if len(close) < 2:
-                    return None, None, []
+                    logger.warning("  %s: not enough forward data", ticker)
+                    continue
 
-                entry = float(close.iloc[0])
-                exit  = float(close.iloc[-1])
+                entry = float(close[0])
+                exit  = float(close[-1])
 
                 if entry == 0:
                     continue
@@ -178,15 +367,24 @@ class Backtest:
                      -2%	          -5%	    good (you lost less)
         """
         try:
-            df = yf.download("^NSEI",start=start.strftime("%Y-%m-%d"),end=end.strftime("%Y-%m-%d"),progress=False,auto_adjust=True)
-            
+            preloaded = self.universe_data.get("^NSEI")
+            if preloaded is not None and self._covers(start, end):
+                window = self.slice_window(preloaded, start, end)
+                if len(window) >= 2:
+                    close = window["Close"].to_numpy()
+                    return float((close[-1] - close[0]) / close[0] * 100)
+
+            key = price_cache.make_key("^NSEI", start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"))
+            df = price_cache.load(key)
+            if df is None:
+                df = _download_nifty(start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"))
+                price_cache.store(key, df)
+
             if len(df) < 2:
                 return 0.0
-            close = df["Close"]
-            if isinstance(close, pd.DataFrame):
-                close = close.iloc[:, 0]
-                
-            return float((close.iloc[-1] - close.iloc[0]) / close.iloc[0] * 100)
+
+            close = df["Close"].to_numpy()
+            return float((close[-1] - close[0]) / close[0] * 100)
             
         except Exception:
             return 0.0
@@ -198,8 +396,8 @@ class Backtest:
         results_df = pd.DataFrame(self.monthly_results)
         picks_df   = pd.DataFrame(self.all_picks)
 
-        results_df.to_csv("outputs/backtests/backtest_results.csv",index=False)
-        picks_df.to_csv("outputs/backtests/backtest_picks.csv",index=False)
+        _write_csv(results_df, "outputs/backtests/backtest_results.csv")
+        _write_csv(picks_df, "outputs/backtests/backtest_picks.csv")
 
         print("")
         logger.info("Saved → backtest_results.csv".center(69))
@@ -225,28 +423,21 @@ class Backtest:
         beat_rate = float((port > nifty).mean() * 100)
         sharpe    = float(port.mean() / port.std()) if port.std() > 0 else 0.0
 
-        equity      = (1 + port / 100).cumprod()
         """
-            x = [2, 3, 4]
-            x.cumprod() -> [2, 6, 24]
-            Because:
-                2
-                2×3 = 6
-                6×4 = 24
-                
+            Max drawdown = worst fall of your money from its peak
+
             port = [2, -1, 3]
             Start with ₹100:
                 Day 1 - 100 * 1.02 = 102
-                Day 2 - 102 * 0.99 = 100.98
+                Day 2 - 102 * 0.99 = 100.98   <- 1% below the 102 peak
                 Day 3 - 100.98 * 1.03 ≈ 104
 
-            equity = [1.02, 1.0098, 1.04]
-            Equity = your money over time
-            so how ur money growed over each time(return)
+            The fused kernel in backtest_engine walks the returns once
+            (no equity/peak/drawdown arrays) and also counts the starting
+            ₹100 as the first peak — losing the very first month now shows
+            up as a drawdown too
         """
-        peak        = equity.cummax()
-        dd          = (equity - peak) / peak * 100
-        max_dd      = float(dd.min())
+        max_dd      = calculate_max_drawdown(port.to_numpy())
 
         downside    = port[port < 0]
         """
@@ -300,57 +491,90 @@ class Backtest:
         return results_df
 
 
-    def run(self) -> pd.DataFrame:
+    def process_month(self, i: int) -> dict:
         """
-            run backtest month by month and store results
-            returns dataframe and saves csv files
+            Screen + measure ONE month (month number i of the backtest)
+
+            Self-contained so the months can run in separate processes:
+            everything it needs (preloaded data, params) lives on self,
+            and it RETURNS its results instead of appending to shared lists
+
+            Returns None when the month produced no picks
         """
         start = datetime(self.start_year, self.start_month, 15)
+        screen_date = start + relativedelta(months=i) # moves the date forward by i months
+        month_str   = screen_date.strftime("%b %Y")
 
+        print("")
         logger.info("─"*71)
-        logger.info("BACKTEST START - %d months from %s".center(69),self.backtest_months,start.strftime("%b %Y"))
+        text = "Month %d / %d — %s" % (i + 1, self.backtest_months, month_str)
+        logger.info("│" + text.center(69) + "│")
+
+        picks = self.screen_on_date(screen_date)
+        if not picks:
+            logger.warning("Skipping %s — no picks".center(69), month_str)
+            return None
+
+        port_return, nifty_return, trades = self.measure_returns(picks, screen_date)
+
+        for t in trades:
+            t["Month"] = month_str
+
+        logger.info("│" + "PERFORMANCE".center(69) + "│")
         logger.info("─"*71)
 
-        for i in range(self.backtest_months):
-            screen_date = start + relativedelta(months=i) # moves the date forward by i months
-            month_str   = screen_date.strftime("%b %Y")
+        line1 = f"{'Portfolio':<12} - {port_return:+8.2f}%"
+        line2 = f"{'Nifty':<12} - {nifty_return:+8.2f}%"
+        line3 = f"{'Alpha':<12} - {(port_return - nifty_return):+8.2f}%"
 
-            print("")
-            logger.info("─"*71)
-            text = "Month %d / %d — %s" % (i + 1, self.backtest_months, month_str)
-            logger.info("│" + text.center(69) + "│")
-            
-            picks = self.screen_on_date(screen_date)
-            if not picks:
-                logger.warning("Skipping %s — no picks".center(69), month_str)
-                continue
+        logger.info("│" + line1.center(69) + "│")
+        logger.info("│" + line2.center(69) + "│")
+        logger.info("│" + line3.center(69) + "│")
 
-            port_return, nifty_return, trades = self.measure_returns(picks, screen_date)
+        logger.info("─"*71)
 
-            self.monthly_results.append({
+        return {
+            "result": {
                 "Month":               month_str,
                 "Portfolio_Return":    round(port_return,2),
                 "Nifty_Return":        round(nifty_return,2),
                 "Outperformance":      round(port_return - nifty_return,2),
                 "Num_Stocks":          len(trades)
-            })
+            },
+            "trades": trades,
+        }
+
+    def run(self, parallel: bool = True) -> pd.DataFrame:
+        """
+            run backtest month by month and store results
+            returns dataframe and saves csv files
 
-            for t in trades:
-                t["Month"] = month_str
-                self.all_picks.append(t)
+            With the downloads preloaded, each month is pure CPU work
+            (indicators + scoring) and independent of the others — so by
+            default the months run across processes. ex.map keeps the
+            results in calendar order regardless of which finishes first.
+            parallel=False runs the plain loop (easier to read logs/debug).
+        """
+        start = datetime(self.start_year, self.start_month, 15)
 
-            logger.info("│" + "PERFORMANCE".center(69) + "│")
-            logger.info("─"*71)
+        logger.info("─"*71)
+        logger.info("BACKTEST START - %d months from %s".center(69),self.backtest_months,start.strftime("%b %Y"))
+        logger.info("─"*71)
 
-            line1 = f"{'Portfolio':<12} - {port_return:+8.2f}%"
-            line2 = f"{'Nifty':<12} - {nifty_return:+8.2f}%"
-            line3 = f"{'Alpha':<12} - {(port_return - nifty_return):+8.2f}%"
+        self.preload_universe(start)
 
-            logger.info("│" + line1.center(69) + "│")
-            logger.info("│" + line2.center(69) + "│")
-            logger.info("│" + line3.center(69) + "│")
+        if parallel and self.backtest_months > 1:
+            workers = min(os.cpu_count() or 1, self.backtest_months)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                outcomes = list(pool.map(self.process_month, range(self.backtest_months)))
+        else:
+            outcomes = [self.process_month(i) for i in range(self.backtest_months)]
 
-            logger.info("─"*71)
+        for outcome in outcomes:
+            if outcome is None:
+                continue
+            self.monthly_results.append(outcome["result"])
+            self.all_picks.extend(outcome["trades"])
 
         return self.save_and_print()
 
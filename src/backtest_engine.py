@@ -50,6 +50,11 @@ from datetime import datetime
 import numpy as np
 import pandas as pd
 
+try:
+    from src._njit import njit
+except ImportError: # keeps `python src/backtest_engine.py` working too
+    from _njit import njit
+
 logger = logging.getLogger(__name__)
 
 INDIA_RF_ANNUAL  = 0.07
@@ -67,13 +72,39 @@ def calculate_sharpe(returns: np.ndarray,risk_free: float = 0.0,annualise: bool
         sharpe *= np.sqrt(periods)
     return sharpe
 
+# no cache=True here: this file also runs as a plain script (its __main__
+# smoke tests), and numba's on-disk cache pins the kernel to whichever
+# module name it was first compiled under
+@njit
+def _max_dd_kernel(returns_pct: np.ndarray) -> float:
+    """
+        Worst drawdown in ONE pass with two scalars
+
+        The old version built three full arrays (equity curve, running max,
+        drawdown) just to take a min. Here we only track the current equity
+        and its peak while walking the returns once — no allocations.
+
+        peak starts at 1.0 = "before the first month" baseline, same as the
+        np.insert(..., 1.0) the array version used.
+    """
+    eq = 1.0
+    peak = 1.0
+    worst = 0.0
+
+    for r in returns_pct:
+        eq *= 1.0 + r * 0.01
+        if eq > peak:
+            peak = eq
+        dd = (eq - peak) / peak * 100.0
+        if dd < worst:
+            worst = dd
+
+    return worst
+
 def calculate_max_drawdown(returns: np.ndarray) -> float:
     if len(returns) == 0:
         return 0.0
-    equity = np.insert((1 + returns / 100).cumprod(), 0, 1.0) # insert is for insert 1 at index 0 bcz starts fro 1 = 100%
-    running_max = np.maximum.accumulate(equity)
-    drawdown = (equity - running_max) / running_max * 100
-    return float(drawdown.min())
+    return float(_max_dd_kernel(np.ascontiguousarray(returns, dtype=np.float64)))
 
 def calculate_win_rate(returns: np.ndarray) -> float:
     if len(returns) == 0:
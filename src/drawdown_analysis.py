@@ -1,7 +1,13 @@
-import pandas as pd
 import numpy as np
 from pathlib import Path
 
+# polars if we have it (Arrow buffers, multithreaded CSV parse),
+# otherwise the numpy path below does the same thing
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
 # Resolve path safely
 ROOT = Path(__file__).resolve().parents[1]
 csv_path = ROOT / "walkforward_results.csv"
@@ -9,25 +15,36 @@ csv_path = ROOT / "walkforward_results.csv"
 if not csv_path.exists():
     csv_path = ROOT / "src" / "walkforward_results.csv"
 
-df = pd.read_csv(csv_path)
+if pl is not None:
+    out = (
+        pl.read_csv(csv_path)
+        .select(((1 + pl.col("portfolio") / 100).cum_prod()).alias("equity"))
+        .with_columns((pl.col("equity") / pl.col("equity").cum_max() - 1).alias("drawdown"))
+    )
+    max_dd = float(out["drawdown"].min())
+    out.write_csv(ROOT / "drawdown_curve.csv")
+else:
+    import pandas as pd
 
-# Equity curve
-equity = (1 + df["portfolio"] / 100).cumprod()
+    df = pd.read_csv(csv_path)
 
+    # work on plain arrays — the pandas version built a Series per step
+    returns = df["portfolio"].to_numpy()
 
-# Drawdown
-rolling_max = equity.cummax()
-drawdown = (equity - rolling_max) / rolling_max
+    # Equity curve
+    equity = np.cumprod(1 + returns / 100)
 
-max_dd = drawdown.min()
+    # Drawdown
+    rolling_max = np.maximum.accumulate(equity)
+    drawdown = (equity - rolling_max) / rolling_max
 
-print(f"Max Drawdown: {max_dd * 100:.2f}%")
+    max_dd = float(drawdown.min())
 
-out = pd.DataFrame({
-    "equity": equity,
-    "drawdown": drawdown
-})
+    out = pd.DataFrame({
+        "equity": equity,
+        "drawdown": drawdown
+    })
+    out.to_csv(ROOT / "drawdown_curve.csv", index=False)
 
-out.to_csv(ROOT / "drawdown_curve.csv", index=False)
+print(f"Max Drawdown: {max_dd * 100:.2f}%")
 print("✓ Saved: drawdown_curve.csv")
-
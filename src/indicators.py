@@ -18,6 +18,172 @@
 
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from src._njit import njit
+
+
+@njit(cache=True)
+def _sma_kernel(values: np.ndarray, window: int) -> np.ndarray:
+    """
+        Moving average in ONE pass over the array
+
+        Instead of re-summing the whole window every day (window × N work),
+        keep a running sum: add today's price, subtract the price that just
+        fell out of the window. Same answer, N additions total.
+
+        Compiled by numba (see _njit.py) so the loop runs at C speed.
+    """
+    n = values.shape[0]
+    out = np.empty(n)
+    running = 0.0
+
+    for i in range(n):
+        running += values[i]
+        if i >= window:
+            running -= values[i - window]
+        out[i] = running / window if i >= window - 1 else np.nan
+
+    return out
+
+
+def sma(values: np.ndarray, window: int = 50) -> np.ndarray:
+    """
+        Array-in, array-out moving average (for callers already on NumPy)
+    """
+    return _sma_kernel(np.ascontiguousarray(values, dtype=np.float64), window)
+
+
+@njit(cache=True)
+def _rsi_wilder_kernel(values: np.ndarray, period: int) -> np.ndarray:
+    """
+        RSI in ONE pass using Wilder's smoothing
+
+        The old version built five intermediate Series (delta, gain, loss,
+        avg_gain, avg_loss) and ran two rolling means over them. Here we
+        walk the prices once and keep two running averages instead.
+
+        Wilder's rule (this is how RSI is actually defined):
+            first `period` days -> plain average of gains / losses (seed)
+            after that          -> avg = (prev_avg * (period-1) + today) / period
+        so old days fade out smoothly instead of dropping off a cliff.
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    avg_gain = 0.0
+    avg_loss = 0.0
+
+    for i in range(1, n):
+        delta = values[i] - values[i - 1]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+
+        if i <= period:
+            avg_gain += gain
+            avg_loss += loss
+            if i == period:
+                avg_gain /= period
+                avg_loss /= period
+                out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss) if avg_loss > 0 else 100.0
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss) if avg_loss > 0 else 100.0
+
+    return out
+
+
+def rsi_wilder(values: np.ndarray, period: int = 14) -> np.ndarray:
+    """
+        Array-in, array-out RSI (for callers already on NumPy)
+    """
+    return _rsi_wilder_kernel(np.ascontiguousarray(values, dtype=np.float64), period)
+
+
+def rolling_dot(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+        Rolling weighted average — THE pattern for any custom rolling op
+
+        If you ever need a weighted MA (WMA, Hull, triangular...), do NOT
+        reach for rolling(window).apply(lambda ...): that calls a Python
+        function once per window and is easily 100x slower.
+
+        Instead:
+            sliding_window_view gives a (N-w+1, w) view of the array with
+            ZERO copying, and one matrix-vector product computes every
+            window's weighted average at once.
+
+        Returns an array the same length as the input, NaN-padded at the
+        front like the other indicators here.
+    """
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
+    w = len(weights)
+
+    out = np.full(len(values), np.nan)
+    if len(values) >= w:
+        windows = sliding_window_view(values, w)
+        out[w - 1:] = windows @ (weights / weights.sum())
+    return out
+
+
+def calculate_wma(price_series: pd.Series, window: int = 20) -> pd.Series:
+    """
+        Linearly weighted moving average
+
+        Like the SMA, but today counts `window` times as much as the
+        oldest day in the window:
+
+            weights = [1, 2, ..., window]
+
+        Reacts faster than SMA, smoother than price itself.
+    """
+    weights = np.arange(1, window + 1, dtype=np.float64)
+    return pd.Series(rolling_dot(price_series.to_numpy(), weights), index=price_series.index)
+
+
+"""
+    In-memory result cache
+
+    During re-runs and parameter sweeps the SAME price window gets its
+    indicators recomputed again and again (same ticker, same screen date).
+    Arrays are not hashable, so the caller supplies a cheap identity key —
+    (ticker, length, last date) pins down a window exactly.
+
+    Bounded: once full, the oldest entry is dropped (dicts keep insertion
+    order) so long sessions cannot grow memory forever.
+"""
+_CACHE_MAX = 1024
+_indicator_cache = {}
+
+
+def _cached(kind: str, key: tuple, values: np.ndarray, param: int, func) -> np.ndarray:
+    full_key = (kind, key, param)
+    hit = _indicator_cache.get(full_key)
+    if hit is not None:
+        return hit
+
+    out = func(values, param)
+    if len(_indicator_cache) >= _CACHE_MAX:
+        _indicator_cache.pop(next(iter(_indicator_cache)))
+    _indicator_cache[full_key] = out
+    return out
+
+
+def cached_sma(key: tuple, values: np.ndarray, window: int = 50) -> np.ndarray:
+    """
+        sma() with memoization — key must uniquely identify the window,
+        e.g. (ticker, len(values), last_date)
+    """
+    return _cached("sma", key, values, window, sma)
+
+
+def cached_rsi(key: tuple, values: np.ndarray, period: int = 14) -> np.ndarray:
+    """
+        rsi_wilder() with memoization — same key contract as cached_sma
+    """
+    return _cached("rsi", key, values, period, rsi_wilder)
+
 
 def calculate_moving_average(price_series: pd.Series, window: int = 50) -> pd.Series:
     """
@@ -44,7 +210,7 @@ def calculate_moving_average(price_series: pd.Series, window: int = 50) -> pd.Se
                  avg(102,101,105) = 102.67
                  avg(101,105,110) = 105.33
     """
-    return price_series.rolling(window=window).mean()
+    return pd.Series(sma(price_series.to_numpy(), window), index=price_series.index)
 
 
 def calculate_ema(price_series: pd.Series, span: int = 12) -> pd.Series:
@@ -109,9 +275,11 @@ def calculate_rsi(price_series: pd.Series, period: int = 14) -> pd.Series:
             gain = delta if positive, else 0
             loss = -delta if negative, else 0
 
-        Take average over last N days (usually 14)
-            avg_gain = average of gains
-            avg_loss = average of losses
+        Average them Wilder-style (usually over 14 days)
+            first 14 days -> plain average (the seed)
+            after that    -> avg = (prev_avg * 13 + today) / 14
+            (this smoothing is part of the RSI definition — a plain
+             rolling mean gives a jumpier, slightly wrong RSI)
 
         Compare them
             RS = avg_gain / avg_loss
@@ -149,16 +317,4 @@ def calculate_rsi(price_series: pd.Series, period: int = 14) -> pd.Series:
 
          High RSI = strong upward movement
     """
-    delta = price_series.diff()
-    gain = delta.where(delta > 0, 0.0)
-    loss = -delta.where(delta < 0, 0.0)
-    avg_gain = gain.rolling(window=period).mean()
-    avg_loss = loss.rolling(window=period).mean()
-    rs = avg_gain / avg_loss
-    
-    """
-        RS can range from 0 to infinity, so we convert it into a clean 0–100 scale
-        to make it easier to interpret
-    """
-    rsi = 100 - (100 / (1 + rs))
-    return rsi
+    return pd.Series(rsi_wilder(price_series.to_numpy(), period), index=price_series.index)
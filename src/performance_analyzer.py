@@ -15,72 +15,517 @@
 """
 
 import os
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
+
 import numpy as np
 import pandas as pd
+
+# Agg = headless backend. Batch reports don't need a GUI window,
+# and skipping the interactive event loop makes savefig noticeably faster
+# Must be set BEFORE pyplot is imported
+import matplotlib
+matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
+import matplotlib.colors as mcolors
 import matplotlib.ticker as mticker
+from matplotlib.collections import PolyCollection
+from matplotlib.patches import Patch
 import seaborn as sns
 
 plt.style.use("seaborn-v0_8-darkgrid")
 sns.set_palette("husl")
 
+# numba is optional -- everything below falls back to plain NumPy
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+# numexpr fuses compound array expressions (no intermediate temporaries,
+# multithreaded) -- also optional
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+
+if _HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _drawdown_kernel(returns):
+        """
+            One fused pass over the monthly returns:
+                equity  : cum *= (1 + r/100)
+                peak    : running max of equity
+                dd      : (cum - peak) / peak * 100
+            while tracking the deepest drawdown and its index
+
+            Replaces cumprod -> maximum.accumulate -> divide, which made
+            three passes and two temporary arrays
+        """
+        n = returns.shape[0]
+        dd = np.empty(n)
+        cum, peak = 1.0, 1.0
+        min_dd, min_idx = 0.0, 0
+        for i in range(n):
+            cum *= 1.0 + returns[i] / 100.0
+            if cum > peak:
+                peak = cum
+            d = (cum - peak) / peak * 100.0
+            dd[i] = d
+            if d < min_dd:
+                min_dd = d
+                min_idx = i
+        return dd, min_dd, min_idx
+
+
+if _HAS_NUMBA:
+    @njit(cache=True)
+    def _stats_kernel(port, nifty, alpha):
+        """
+            All the print_statistics aggregates in ONE pass over the three
+            columns: running sum / sum-of-squares / min / max for the
+            portfolio, positive and negative sums + counts (win rate,
+            avg win/loss, downside std), nifty moments and alpha extremes.
+
+            Replaces ~15 separate O(N) NumPy reductions with one loop
+        """
+        n = port.shape[0]
+        p_sum = p_sumsq = 0.0
+        p_min = p_max = port[0]
+        pos_sum = neg_sum = neg_sumsq = 0.0
+        n_pos = n_neg = 0
+        nf_sum = nf_sumsq = 0.0
+        a_sum = 0.0
+        a_min = a_max = alpha[0]
+        n_beat = 0
+        for i in range(n):
+            p = port[i]
+            p_sum += p
+            p_sumsq += p * p
+            if p < p_min:
+                p_min = p
+            if p > p_max:
+                p_max = p
+            if p > 0:
+                n_pos += 1
+                pos_sum += p
+            elif p < 0:
+                n_neg += 1
+                neg_sum += p
+                neg_sumsq += p * p
+            v = nifty[i]
+            nf_sum += v
+            nf_sumsq += v * v
+            a = alpha[i]
+            a_sum += a
+            if a < a_min:
+                a_min = a
+            if a > a_max:
+                a_max = a
+            if a > 0:
+                n_beat += 1
+        return (p_sum, p_sumsq, p_min, p_max,
+                n_pos, pos_sum, n_neg, neg_sum, neg_sumsq,
+                nf_sum, nf_sumsq, a_sum, a_min, a_max, n_beat)
+
+
+# everything print_statistics needs, precomputed in one place
+ReportStats = namedtuple("ReportStats", [
+    "mean", "median", "std", "min", "max",
+    "n_pos", "n_neg", "avg_win", "avg_loss", "downside_std",
+    "nifty_mean", "nifty_std",
+    "alpha_mean", "alpha_min", "alpha_max", "n_beat",
+])
+
+
+def _partition_median(values: np.ndarray) -> float:
+    """
+        O(N) median via np.partition -- np.median fully sorts, which is
+        the only O(N log N) step left in the stats report
+    """
+    n = len(values)
+    if n % 2:
+        return float(np.partition(values, n // 2)[n // 2])
+    part = np.partition(values, [n // 2 - 1, n // 2])
+    return float(part[n // 2 - 1] + part[n // 2]) / 2
+
+
+def _summary_stats(port: np.ndarray, nifty: np.ndarray, alpha: np.ndarray) -> ReportStats:
+    """Aggregate the three result columns for the statistics report."""
+    n = len(port)
+
+    if _HAS_NUMBA:
+        (p_sum, p_sumsq, p_min, p_max,
+         n_pos, pos_sum, n_neg, neg_sum, neg_sumsq,
+         nf_sum, nf_sumsq, a_sum, a_min, a_max, n_beat) = _stats_kernel(
+            np.ascontiguousarray(port,  dtype=np.float64),
+            np.ascontiguousarray(nifty, dtype=np.float64),
+            np.ascontiguousarray(alpha, dtype=np.float64))
+    else:
+        p_sum, p_sumsq = float(port.sum()), float((port * port).sum())
+        p_min, p_max = float(port.min()), float(port.max())
+        # masked reductions: port[port<0] would allocate a gathered copy
+        # per mask; np.where keeps the reduction on the original buffer
+        pos_mask, neg_mask = port > 0, port < 0
+        n_pos, n_neg = int(pos_mask.sum()), int(neg_mask.sum())
+        pos_sum   = float(np.where(pos_mask, port, 0.0).sum())
+        neg_sum   = float(np.where(neg_mask, port, 0.0).sum())
+        neg_sumsq = float(np.where(neg_mask, port * port, 0.0).sum())
+        nf_sum, nf_sumsq = float(nifty.sum()), float((nifty * nifty).sum())
+        a_sum = float(alpha.sum())
+        a_min, a_max = float(alpha.min()), float(alpha.max())
+        n_beat = int((alpha > 0).sum())
+
+    mean = p_sum / n
+    var  = max(p_sumsq / n - mean * mean, 0.0)
+
+    if n_neg > 0:
+        neg_mean = neg_sum / n_neg
+        downside_var = max(neg_sumsq / n_neg - neg_mean * neg_mean, 0.0)
+    else:
+        downside_var = 0.0
+
+    nf_mean = nf_sum / n
+
+    return ReportStats(
+        mean         = mean,
+        median       = _partition_median(port),
+        std          = var ** 0.5,
+        min          = p_min,
+        max          = p_max,
+        n_pos        = int(n_pos),
+        n_neg        = int(n_neg),
+        avg_win      = pos_sum / n_pos if n_pos else 0.0,
+        avg_loss     = neg_sum / n_neg if n_neg else 0.0,
+        downside_std = downside_var ** 0.5,
+        nifty_mean   = nf_mean,
+        nifty_std    = max(nf_sumsq / n - nf_mean * nf_mean, 0.0) ** 0.5,
+        alpha_mean   = a_sum / n,
+        alpha_min    = a_min,
+        alpha_max    = a_max,
+        n_beat       = int(n_beat),
+    )
+
+
+def _drawdown_stats(returns: np.ndarray) -> tuple:
+    """(drawdown %, max drawdown, index of max drawdown) for a return series."""
+    if _HAS_NUMBA:
+        dd, min_dd, min_idx = _drawdown_kernel(
+            np.ascontiguousarray(returns, dtype=np.float64))
+        return dd, float(min_dd), int(min_idx)
+
+    equity      = (1 + returns / 100).cumprod()
+    running_max = np.maximum.accumulate(equity)
+    if ne is not None:
+        dd = ne.evaluate("(equity - running_max) / running_max * 100")
+    else:
+        dd = (equity - running_max) / running_max * 100
+    idx = int(np.argmin(dd))
+    return dd, float(dd[idx]), idx
+
 PLOT_DIR = "outputs/plots"
 
+# only the columns the analyzer actually reads -- skipping the rest
+# (Num_Stocks, Entry_Price, ...) means less parsing and less memory
+RESULTS_COLS  = ["Month", "Portfolio_Return", "Nifty_Return", "Outperformance"]
+PICKS_COLS    = ["Ticker", "Score", "Return"]
+
+# float32 is plenty of precision for % returns and halves the bytes
+RESULTS_DTYPE = {"Portfolio_Return": "float32", "Nifty_Return": "float32", "Outperformance": "float32"}
+PICKS_DTYPE   = {"Score": "float32", "Return": "float32"}
+
+# picks files bigger than this are aggregated in streamed chunks rather
+# than through the in-memory DataFrame
+STREAM_THRESHOLD = 1_000_000
+STREAM_CHUNKSIZE = 500_000
+
+# smallest a picks row can plausibly be ("T,0.0,0.0\n") -- used to rule
+# out files too small to cross STREAM_THRESHOLD without opening them
+MIN_ROW_BYTES = 8
+
+# score-vs-return regression, fitted once and shared between the scatter
+# plot and the statistics report
+ScoreReturnStats = namedtuple(
+    "ScoreReturnStats", ["scores", "returns", "slope", "intercept", "correlation"])
+
+
+def _bar_vertices(centers: np.ndarray, heights: np.ndarray, width: float) -> np.ndarray:
+    """
+        Rectangle corner coordinates for a whole bar series, shape (N, 4, 2)
+
+        Feeding these into one PolyCollection gives a single artist for the
+        series instead of one Rectangle per bar, which is what makes long
+        backtests slow to render
+    """
+    left  = centers - width / 2
+    right = centers + width / 2
+    verts = np.zeros((len(centers), 4, 2))
+    verts[:, 0, 0] = left
+    verts[:, 1, 0] = left
+    verts[:, 1, 1] = heights
+    verts[:, 2, 0] = right
+    verts[:, 2, 1] = heights
+    verts[:, 3, 0] = right
+    return verts
+
+
+def _read_csv(path: str, usecols: list, dtype: dict) -> pd.DataFrame:
+    """
+        Typed CSV read restricted to the columns we use
+
+        The pyarrow engine parses the whole file in one multithreaded pass
+        instead of the row-by-row C parser, which matters once the backtest
+        logs grow. Falls back to the default engine if pyarrow isn't
+        installed or the file predates the current column layout
+    """
+    try:
+        return pd.read_csv(path, engine="pyarrow", usecols=usecols, dtype=dtype)
+    except FileNotFoundError:
+        raise
+    except (ImportError, ValueError):
+        return pd.read_csv(path, usecols=usecols, dtype=dtype)
+
+
+def _over_stream_threshold(path: str) -> bool:
+    """
+        True when the picks CSV holds more than STREAM_THRESHOLD data rows
+
+        Probed BEFORE the eager read in __init__, so a huge picks log is
+        never materialized at all. Two stages, both cheap: os.path.getsize
+        rules out files too small to possibly cross the threshold, and only
+        then are raw newlines counted in 1 MiB binary blocks -- no CSV
+        parsing, O(1) memory, early exit as soon as the answer is yes
+    """
+    if os.path.getsize(path) <= STREAM_THRESHOLD * MIN_ROW_BYTES:
+        return False
+    rows = -1                           # don't count the header line
+    with open(path, "rb") as fh:
+        while block := fh.read(1 << 20):
+            rows += block.count(b"\n")
+            if rows > STREAM_THRESHOLD:
+                return True
+    return rows > STREAM_THRESHOLD
+
 
 class PerformanceAnalyzer:
 
     def __init__(self,
         results_file: str = "outputs/backtests/backtest_results.csv",
-        picks_file: str = "outputs/backtests/backtest_picks.csv"
+        picks_file: str = "outputs/backtests/backtest_picks.csv",
+        interactive: bool = False,
+        dpi: int = 150
     ):
+        """
+            interactive=True pops up each chart (needs a display)
+            interactive=False (default) just writes the PNGs -- right for batch runs
+
+            dpi: raster resolution of the saved PNGs. Rasterisation cost
+            scales with dpi squared -- 150 is plenty for on-screen reports
+            and ~4x cheaper than the old 300
+        """
+        self.interactive  = interactive
+        self.dpi          = dpi
+        self.results_file = results_file
+        self.picks_file   = picks_file
+        self.force        = False   # True = redraw even if the PNG is up to date
         os.makedirs(PLOT_DIR, exist_ok = True)
 
         try:
-            self.results = pd.read_csv(results_file)
+            self.results = _read_csv(results_file, RESULTS_COLS, RESULTS_DTYPE)
             print(f"Loaded {len(self.results)} months from {results_file}")
         except FileNotFoundError:
             print(f"Results file not found: {results_file}")
             self.results = None
 
         try:
-            self.picks = pd.read_csv(picks_file)
-            print(f"Loaded {len(self.picks)} picks from {picks_file}")
+            if _over_stream_threshold(picks_file):
+                # leave the frame on disk: _ticker_counter streams the
+                # Ticker column and _score_return_stats pulls just the two
+                # float32 columns, so peak memory stays O(unique tickers)
+                # however long the backtest ran
+                self.picks = None
+                self._stream_picks = True
+                print(f"Picks file exceeds {STREAM_THRESHOLD:,} rows "
+                      f"-- using streamed aggregation")
+            else:
+                self.picks = _read_csv(picks_file, PICKS_COLS, PICKS_DTYPE)
+                self._stream_picks = False
+                print(f"Loaded {len(self.picks)} picks from {picks_file}")
         except FileNotFoundError:
             print(f"Picks file not found: {picks_file}")
             self.picks = None
+            self._stream_picks = False
+
+        self.has_picks = self.picks is not None or self._stream_picks
 
 
 
-    def _save(self, filename: str) -> None:
+    def _save(self, fig, filename: str) -> None:
         path = os.path.join(PLOT_DIR, filename)
-        plt.savefig(path, dpi=300, bbox_inches="tight")
+        # no bbox_inches="tight" -- that renders the figure twice just to
+        # measure it; tight_layout in _finish already sizes the axes.
+        # compress_level=1 trades a few % of file size for a much faster
+        # PNG encode
+        fig.savefig(path, dpi=self.dpi,
+                    pil_kwargs={"optimize": False, "compress_level": 1})
         print(f"Saved  {path}")
 
+    def _is_fresh(self, filename: str) -> bool:
+        """
+            True when the PNG on disk is already newer than both input
+            CSVs -- nothing changed, so redrawing it would produce the
+            identical file. Lets repeated report runs cost nothing
+        """
+        if self.force:
+            return False
+        path = os.path.join(PLOT_DIR, filename)
+        if not os.path.exists(path):
+            return False
+        try:
+            src_mtime = os.path.getmtime(self.results_file)
+            if self.has_picks:
+                src_mtime = max(src_mtime, os.path.getmtime(self.picks_file))
+        except OSError:
+            return False
+        return os.path.getmtime(path) > src_mtime
+
+
+    def _finish(self, fig, filename: str, save: bool) -> None:
+        """
+            Common ending for every plot method:
+                save the PNG, show only in interactive mode,
+                then close the figure so memory is freed between
+                the six plots generate_report() produces
+        """
+        plt.tight_layout()
+        if save:
+            self._save(fig, filename)
+        if self.interactive:
+            plt.show()
+        plt.close(fig)
+
+
+    """
+        Derived arrays, computed once per instance
+
+        generate_report() calls six plot methods plus print_statistics
+        back to back, and several of them need the same equity curve /
+        drawdown series. cached_property computes each one on first
+        access and stores it on the instance, so the cumprod etc. run
+        exactly once per report instead of once per method
+
+        If self.results is ever reassigned, invalidate with
+        self.__dict__.pop("_portfolio_cum", None) etc.
+    """
+
+    @cached_property
+    def _portfolio_ret(self) -> np.ndarray:
+        # contiguous float32: % returns don't need double precision, and
+        # half the bytes means half the memory traffic in every pass below
+        return np.ascontiguousarray(
+            self.results["Portfolio_Return"].to_numpy(dtype=np.float32))
+
+    @cached_property
+    def _nifty_ret(self) -> np.ndarray:
+        return np.ascontiguousarray(
+            self.results["Nifty_Return"].to_numpy(dtype=np.float32))
+
+    @cached_property
+    def _alpha(self) -> np.ndarray:
+        return np.ascontiguousarray(
+            self.results["Outperformance"].to_numpy(dtype=np.float32))
+
+    @cached_property
+    def _months(self) -> np.ndarray:
+        return self.results["Month"].to_numpy()
+
+    @cached_property
+    def _portfolio_cum(self) -> np.ndarray:
+        # equity curve: 1.0 = starting capital
+        # fuse the 1 + r/100 step with numexpr, then cumprod in place
+        r = self._portfolio_ret
+        cum = ne.evaluate("1 + r / 100") if ne is not None else 1 + r / 100
+        return np.cumprod(cum, out=cum)
+
+    @cached_property
+    def _nifty_cum(self) -> np.ndarray:
+        r = self._nifty_ret
+        cum = ne.evaluate("1 + r / 100") if ne is not None else 1 + r / 100
+        return np.cumprod(cum, out=cum)
+
+    @cached_property
+    def _ticker_counter(self) -> Counter:
+        """
+            Ticker -> times picked, aggregated without loading the frame
+
+            Streams just the Ticker column in chunks, so memory stays
+            O(unique tickers) no matter how long the picks log is. Only
+            ever touched in streamed mode
+        """
+        counter = Counter()
+        for chunk in pd.read_csv(self.picks_file,
+                                 usecols=["Ticker"], chunksize=STREAM_CHUNKSIZE):
+            counter.update(chunk["Ticker"].to_numpy().tolist())
+        return counter
+
+    @cached_property
+    def _score_return_stats(self) -> ScoreReturnStats:
+        # polyfit + corrcoef on contiguous float32 views, computed once.
+        # the fit needs every point, so in streamed mode we still read the
+        # file -- but only the two float32 columns (8 bytes/row), not the
+        # full frame with its ticker strings
+        if self.picks is not None:
+            picks = self.picks
+        else:
+            picks = _read_csv(self.picks_file, ["Score", "Return"], PICKS_DTYPE)
+        scores  = np.ascontiguousarray(picks["Score"].to_numpy(dtype=np.float32))
+        returns = np.ascontiguousarray(picks["Return"].to_numpy(dtype=np.float32))
+        slope, intercept = np.polyfit(scores, returns, 1)
+        corr = float(np.corrcoef(scores, returns)[0, 1])
+        return ScoreReturnStats(scores, returns, float(slope), float(intercept), corr)
 
-    def _equity_curve(self) -> np.ndarray:
-        return (1 + self.results["Portfolio_Return"] / 100).cumprod().values
+    @cached_property
+    def _drawdown_stats(self) -> tuple:
+        # (drawdown array, max drawdown %, index of max drawdown)
+        return _drawdown_stats(self._portfolio_ret)
 
-    def _nifty_curve(self) -> np.ndarray:
-        return (1 + self.results["Nifty_Return"] / 100).cumprod().values
+    @cached_property
+    def _drawdown(self) -> np.ndarray:
+        return self._drawdown_stats[0]
 
 
 
-    def plot_cumulative_returns(self, save: bool = True) -> None:
+    def plot_cumulative_returns(self, save: bool = True, ax=None) -> None:
         """Cumulative return of portfolio vs Nifty 50."""
         if self.results is None:
             return
+        if ax is None and save and self._is_fresh("cumulative_returns.png"):
+            return
 
-        port_cum  = self._equity_curve()  - 1
-        nifty_cum = self._nifty_curve()   - 1
-        months    = range(1, len(self.results) + 1)
-
-        fig, ax = plt.subplots(figsize=(14, 7))
-
-        ax.plot(months, port_cum  * 100, label="Portfolio",
+        port_cum  = self._portfolio_cum
+        nifty_cum = self._nifty_cum
+        if ne is not None:
+            # single fused expression instead of (x - 1) temp then * 100 temp
+            port_pct  = ne.evaluate("(port_cum - 1) * 100")
+            nifty_pct = ne.evaluate("(nifty_cum - 1) * 100")
+        else:
+            port_pct  = (port_cum  - 1) * 100
+            nifty_pct = (nifty_cum - 1) * 100
+        months = range(1, len(self.results) + 1)
+
+        own_fig = ax is None
+        if own_fig:
+            fig, ax = plt.subplots(figsize=(14, 7))
+
+        ax.plot(months, port_pct, label="Portfolio",
                 linewidth=2.5, marker="o", markersize=5)
-        ax.plot(months, nifty_cum * 100, label="Nifty 50",
+        ax.plot(months, nifty_pct, label="Nifty 50",
                 linewidth=2.5, marker="s", markersize=5, alpha=0.75)
-        ax.fill_between(months, port_cum * 100, nifty_cum * 100, alpha=0.15)
+        ax.fill_between(months, port_pct, nifty_pct, alpha=0.15)
         ax.axhline(0, color="black", linewidth=1, linestyle="--", alpha=0.4)
 
         ax.set_xlabel("Month",                  fontsize=12, fontweight="bold")
@@ -90,31 +535,43 @@ class PerformanceAnalyzer:
         ax.legend(fontsize=11)
         ax.yaxis.set_major_formatter(mticker.FormatStrFormatter("%.1f%%"))
 
-        plt.tight_layout()
-        if save:
-            self._save("cumulative_returns.png")
-        plt.show()
+        if own_fig:
+            self._finish(fig, "cumulative_returns.png", save)
 
 
-    def plot_monthly_returns(self, save: bool = True) -> None:
+    def plot_monthly_returns(self, save: bool = True, ax=None) -> None:
         """Side-by-side bar chart of monthly portfolio vs Nifty returns."""
         if self.results is None:
             return
+        if ax is None and save and self._is_fresh("monthly_returns.png"):
+            return
 
-        portfolio = self.results["Portfolio_Return"].values
-        nifty     = self.results["Nifty_Return"].values
+        portfolio = self._portfolio_ret
+        nifty     = self._nifty_ret
         x         = np.arange(len(self.results))
         width     = 0.35
 
-        fig, ax = plt.subplots(figsize=(14, 7))
-
-        port_colors  = ["#2ecc71" if r >= 0 else "#e74c3c" for r in portfolio]
-        nifty_colors = ["#27ae60" if r >= 0 else "#c0392b" for r in nifty]
-
-        ax.bar(x - width / 2, portfolio, width,
-               color=port_colors,  alpha=0.85, edgecolor="black", label="Portfolio")
-        ax.bar(x + width / 2, nifty,     width,
-               color=nifty_colors, alpha=0.65, edgecolor="black", label="Nifty 50")
+        own_fig = ax is None
+        if own_fig:
+            fig, ax = plt.subplots(figsize=(14, 7))
+
+        # one PolyCollection per series (2 artists total) instead of one
+        # Rectangle artist per bar (2N artists) -- RGBA chosen per bar via
+        # a broadcast np.where on the sign mask
+        port_rgba = np.where((portfolio >= 0)[:, None],
+                             np.array(mcolors.to_rgba("#2ecc71", 0.85)),
+                             np.array(mcolors.to_rgba("#e74c3c", 0.85)))
+        nifty_rgba = np.where((nifty >= 0)[:, None],
+                              np.array(mcolors.to_rgba("#27ae60", 0.65)),
+                              np.array(mcolors.to_rgba("#c0392b", 0.65)))
+
+        port_bars = PolyCollection(_bar_vertices(x - width / 2, portfolio, width),
+                                   facecolors=port_rgba, edgecolors="black")
+        nifty_bars = PolyCollection(_bar_vertices(x + width / 2, nifty, width),
+                                    facecolors=nifty_rgba, edgecolors="black")
+        ax.add_collection(port_bars)
+        ax.add_collection(nifty_bars)
+        ax.autoscale_view()
 
         ax.axhline(0, color="black", linewidth=1)
         ax.set_xlabel("Month",         fontsize=12, fontweight="bold")
@@ -122,28 +579,37 @@ class PerformanceAnalyzer:
         ax.set_title("Monthly Returns  —  Portfolio vs Nifty 50",
                      fontsize=14, fontweight="bold", pad=16)
         ax.set_xticks(x)
-        ax.set_xticklabels(self.results["Month"], rotation=45, ha="right")
-        ax.legend(fontsize=11)
+        ax.set_xticklabels(self._months, rotation=45, ha="right")
+        # proxy patches -- collections don't carry legend entries themselves
+        ax.legend(handles=[
+            Patch(facecolor="#2ecc71", edgecolor="black", alpha=0.85, label="Portfolio"),
+            Patch(facecolor="#27ae60", edgecolor="black", alpha=0.65, label="Nifty 50"),
+        ], fontsize=11)
         ax.yaxis.set_major_formatter(mticker.FormatStrFormatter("%.1f%%"))
 
-        plt.tight_layout()
-        if save:
-            self._save("monthly_returns.png")
-        plt.show()
+        if own_fig:
+            self._finish(fig, "monthly_returns.png", save)
 
 
-    def plot_outperformance(self, save: bool = True) -> None:
+    def plot_outperformance(self, save: bool = True, ax=None) -> None:
         """Bar chart of monthly alpha (portfolio minus benchmark)."""
         if self.results is None:
             return
+        if ax is None and save and self._is_fresh("outperformance.png"):
+            return
 
-        alpha  = self.results["Outperformance"].values
-        months = self.results["Month"].values
-        colors = ["#2ecc71" if x >= 0 else "#e74c3c" for x in alpha]
+        alpha  = self._alpha
+        months = self._months
+        # one int32 position array reused for both the bars and the ticks
+        # (range() here would be re-iterated in Python by the tick locator)
+        x      = np.arange(len(months), dtype=np.int32)
+        colors = np.where(alpha >= 0, "#2ecc71", "#e74c3c")
 
-        fig, ax = plt.subplots(figsize=(14, 7))
+        own_fig = ax is None
+        if own_fig:
+            fig, ax = plt.subplots(figsize=(14, 7))
 
-        ax.bar(range(len(months)), alpha, color=colors, alpha=0.8, edgecolor="black")
+        ax.bar(x, alpha, color=colors, alpha=0.8, edgecolor="black")
         ax.axhline(0, color="black", linewidth=1.5)
 
         avg_alpha = np.mean(alpha)
@@ -154,33 +620,30 @@ class PerformanceAnalyzer:
         ax.set_ylabel("Outperformance (%)",      fontsize=12, fontweight="bold")
         ax.set_title("Monthly Alpha  —  Portfolio minus Benchmark",
                      fontsize=14, fontweight="bold", pad=16)
-        ax.set_xticks(range(len(months)))
+        ax.set_xticks(x)
         ax.set_xticklabels(months, rotation=45, ha="right")
         ax.legend(fontsize=11)
         ax.yaxis.set_major_formatter(mticker.FormatStrFormatter("%.1f%%"))
 
-        plt.tight_layout()
-        if save:
-            self._save("outperformance.png")
-        plt.show()
+        if own_fig:
+            self._finish(fig, "outperformance.png", save)
 
 
-    def plot_drawdown(self, save: bool = True) -> None:
+    def plot_drawdown(self, save: bool = True, ax=None) -> None:
         """Underwater / drawdown chart of portfolio equity curve."""
         if self.results is None:
             return
+        if ax is None and save and self._is_fresh("drawdown.png"):
+            return
 
-        equity      = self._equity_curve()
-        running_max = np.maximum.accumulate(equity)
-        drawdown    = (equity - running_max) / running_max * 100
+        drawdown, max_dd, max_dd_idx = self._drawdown_stats
 
-        fig, ax = plt.subplots(figsize=(14, 7))
+        own_fig = ax is None
+        if own_fig:
+            fig, ax = plt.subplots(figsize=(14, 7))
 
         ax.fill_between(range(len(drawdown)), drawdown, 0, color="#e74c3c", alpha=0.30)
         ax.plot(drawdown, color="#c0392b", linewidth=2)
-
-        max_dd     = np.min(drawdown)
-        max_dd_idx = np.argmin(drawdown)
         ax.axhline(max_dd, color="#e74c3c", linestyle="--",
                    label=f"Max drawdown  {max_dd:.2f}%")
         ax.scatter(max_dd_idx, max_dd, color="#c0392b", s=90, zorder=5)
@@ -192,29 +655,59 @@ class PerformanceAnalyzer:
         ax.legend(fontsize=11)
         ax.yaxis.set_major_formatter(mticker.FormatStrFormatter("%.1f%%"))
 
-        plt.tight_layout()
-        if save:
-            self._save("drawdown.png")
-        plt.show()
+        if own_fig:
+            self._finish(fig, "drawdown.png", save)
+
 
+    def _ticker_counts(self, top_n: int) -> tuple:
+        """
+            Top-N (tickers, counts), most frequent first
 
-    def plot_stock_frequency(self, save: bool = True, top_n: int = 10) -> None:
+            Small histories are counted straight off the in-memory picks
+            DataFrame. Logs past STREAM_THRESHOLD rows were never loaded
+            (__init__ probes the file first), so here they go through the
+            streamed Counter instead -- memory stays O(unique tickers) no
+            matter how long the backtest ran
+        """
+        if self._stream_picks:
+            pairs = self._ticker_counter.most_common(top_n)
+            return (np.array([t for t, _ in pairs]),
+                    np.array([c for _, c in pairs]))
+
+        # value_counts() sorts EVERY unique ticker just to keep the top 10
+        # unique + argpartition only fully sorts the k winners:
+        # O(U + k log k) instead of O(U log U)
+        tickers, freqs = np.unique(self.picks["Ticker"].to_numpy(), return_counts=True)
+        k     = min(top_n, len(tickers))
+        idx   = np.argpartition(-freqs, k - 1)[:k]
+        order = idx[np.argsort(-freqs[idx])]          # descending, like value_counts
+        return tickers[order], freqs[order]
+
+
+    def plot_stock_frequency(self, save: bool = True, top_n: int = 10, ax=None) -> None:
         """Horizontal bar chart of most frequently selected stocks."""
-        if self.picks is None:
+        if not self.has_picks:
             print("No picks data available for stock frequency chart")
             return
+        if ax is None and save and self._is_fresh("stock_frequency.png"):
+            return
+
+        top_tickers, top_counts = self._ticker_counts(top_n)
+        k = len(top_tickers)
 
-        counts = self.picks["Ticker"].value_counts().head(top_n)
-        colors = sns.color_palette("viridis", len(counts))
+        colors = sns.color_palette("viridis", k)
 
-        fig, ax = plt.subplots(figsize=(12, 7))
+        own_fig = ax is None
+        if own_fig:
+            fig, ax = plt.subplots(figsize=(12, 7))
 
-        ax.barh(range(len(counts)), counts.values,
+        y = np.arange(k, dtype=np.int32)
+        ax.barh(y, top_counts,
                 color=colors, edgecolor="black")
-        ax.set_yticks(range(len(counts)))
-        ax.set_yticklabels(counts.index, fontsize=11)
+        ax.set_yticks(y)
+        ax.set_yticklabels(top_tickers, fontsize=11)
 
-        for i, v in enumerate(counts.values):
+        for i, v in enumerate(top_counts):
             ax.text(v + 0.05, i, str(v), va="center", fontweight="bold")
 
         ax.set_xlabel("Times Selected",             fontsize=12, fontweight="bold")
@@ -223,36 +716,44 @@ class PerformanceAnalyzer:
                      fontsize=14, fontweight="bold", pad=16)
         ax.xaxis.set_major_locator(mticker.MaxNLocator(integer=True))
 
-        plt.tight_layout()
-        if save:
-            self._save("stock_frequency.png")
-        plt.show()
+        if own_fig:
+            self._finish(fig, "stock_frequency.png", save)
 
 
-    def plot_score_vs_return(self, save: bool = True) -> None:
+    def plot_score_vs_return(self, save: bool = True, ax=None) -> None:
         """Scatter plot: model score vs actual trade return with trend line."""
-        if self.picks is None:
+        if not self.has_picks:
             print("No picks data available for score vs return chart")
             return
+        if ax is None and save and self._is_fresh("score_vs_return.png"):
+            return
 
-        scores  = self.picks["Score"].values
-        returns = self.picks["Return"].values
-        colors  = ["#2ecc71" if r >= 0 else "#e74c3c" for r in returns]
+        stats   = self._score_return_stats
+        scores  = stats.scores
+        returns = stats.returns
 
-        fig, ax = plt.subplots(figsize=(12, 7))
+        own_fig = ax is None
+        if own_fig:
+            fig, ax = plt.subplots(figsize=(12, 7))
 
-        ax.scatter(scores, returns, c=colors, alpha=0.65, s=90, edgecolors="black")
+        # per-point RGBA array filled by boolean mask -- no Python colour
+        # list, no per-marker edge strokes. rasterized=True renders the
+        # whole PathCollection through Agg in one shot instead of writing
+        # thousands of vector paths into the PNG at full dpi
+        rgba = np.empty((len(returns), 4), dtype=np.float32)
+        rgba[:] = (0.18, 0.80, 0.44, 0.65)              # winners  (green)
+        rgba[returns <= 0] = (0.91, 0.30, 0.24, 0.65)   # losers   (red)
+        ax.scatter(scores, returns, c=rgba, s=64, linewidths=0, rasterized=True)
 
-        z = np.polyfit(scores, returns, 1)
         x_line = np.linspace(scores.min(), scores.max(), 200)
-        ax.plot(x_line, np.poly1d(z)(x_line), color="#2980b9", linewidth=2,
-                linestyle="--", label=f"Trend  y = {z[0]:.2f}x + {z[1]:.2f}")
+        ax.plot(x_line, stats.slope * x_line + stats.intercept,
+                color="#2980b9", linewidth=2, linestyle="--",
+                label=f"Trend  y = {stats.slope:.2f}x + {stats.intercept:.2f}")
 
         ax.axhline(0, color="black", linewidth=1)
         ax.axvline(0, color="black", linewidth=1)
 
-        corr = np.corrcoef(scores, returns)[0, 1]
-        ax.text(0.05, 0.95, f"Correlation  {corr:.3f}",
+        ax.text(0.05, 0.95, f"Correlation  {stats.correlation:.3f}",
                 transform=ax.transAxes, fontsize=11,
                 verticalalignment="top",
                 bbox=dict(boxstyle="round", facecolor="wheat", alpha=0.5))
@@ -264,10 +765,8 @@ class PerformanceAnalyzer:
         ax.legend(fontsize=11)
         ax.yaxis.set_major_formatter(mticker.FormatStrFormatter("%.1f%%"))
 
-        plt.tight_layout()
-        if save:
-            self._save("score_vs_return.png")
-        plt.show()
+        if own_fig:
+            self._finish(fig, "score_vs_return.png", save)
 
 
     # statistics report
@@ -276,9 +775,12 @@ class PerformanceAnalyzer:
         if self.results is None:
             return
 
-        portfolio = self.results["Portfolio_Return"].values
-        nifty     = self.results["Nifty_Return"].values
-        alpha     = self.results["Outperformance"].values
+        portfolio = self._portfolio_ret
+        nifty     = self._nifty_ret
+        alpha     = self._alpha
+
+        # every aggregate below comes from one pass over the columns
+        st = _summary_stats(portfolio, nifty, alpha)
 
         W = 80
         SEP = "─" * W
@@ -296,26 +798,21 @@ class PerformanceAnalyzer:
         print()
         print("  Return Statistics")
         print()
-        row("Portfolio mean",    f"{np.mean(portfolio):+.2f}%")
-        row("Portfolio median",  f"{np.median(portfolio):+.2f}%")
-        row("Portfolio std dev", f"{np.std(portfolio):.2f}%")
-        row("Portfolio min",     f"{np.min(portfolio):+.2f}%")
-        row("Portfolio max",     f"{np.max(portfolio):+.2f}%")
+        row("Portfolio mean",    f"{st.mean:+.2f}%")
+        row("Portfolio median",  f"{st.median:+.2f}%")
+        row("Portfolio std dev", f"{st.std:.2f}%")
+        row("Portfolio min",     f"{st.min:+.2f}%")
+        row("Portfolio max",     f"{st.max:+.2f}%")
         print()
-        row("Nifty mean",        f"{np.mean(nifty):+.2f}%")
-        row("Nifty std dev",     f"{np.std(nifty):.2f}%")
+        row("Nifty mean",        f"{st.nifty_mean:+.2f}%")
+        row("Nifty std dev",     f"{st.nifty_std:.2f}%")
 
         # risk-adjusted metrics
-        sharpe = np.mean(portfolio) / np.std(portfolio) if np.std(portfolio) > 0 else 0.0
-
-        downside = portfolio[portfolio < 0]
-        sortino  = (np.mean(portfolio) / np.std(downside)
-                    if len(downside) > 1 else 0.0)
+        sharpe  = st.mean / st.std if st.std > 0 else 0.0
+        sortino = (st.mean / st.downside_std
+                   if st.n_neg > 1 and st.downside_std > 0 else 0.0)
 
-        equity      = (1 + portfolio / 100).cumprod()
-        running_max = np.maximum.accumulate(equity)
-        drawdown    = (equity - running_max) / running_max * 100
-        max_dd      = float(drawdown.min())
+        max_dd = self._drawdown_stats[1]
 
         print()
         print("  Risk-Adjusted Metrics")
@@ -325,13 +822,13 @@ class PerformanceAnalyzer:
         row("Max drawdown",  f"{max_dd:.2f}%")
 
         # win / loss
-        wins     = int((portfolio > 0).sum())
-        losses   = int((portfolio < 0).sum())
+        wins     = st.n_pos
+        losses   = st.n_neg
         win_rate = wins / len(portfolio) * 100
 
-        avg_win  = np.mean(portfolio[portfolio > 0]) if wins  > 0 else 0.0
-        avg_loss = np.mean(portfolio[portfolio < 0]) if losses > 0 else 0.0
-        wl_ratio = abs(avg_win / avg_loss)           if avg_loss != 0 else 0.0
+        avg_win  = st.avg_win
+        avg_loss = st.avg_loss
+        wl_ratio = abs(avg_win / avg_loss) if avg_loss != 0 else 0.0
 
         print()
         print("  Win / Loss")
@@ -343,28 +840,36 @@ class PerformanceAnalyzer:
         row("Win / loss ratio", f"{wl_ratio:.2f}")
 
         # alpha
-        beat_n    = int((alpha > 0).sum())
+        beat_n    = st.n_beat
         beat_rate = beat_n / len(alpha) * 100
 
         print()
         print("  Alpha")
         print()
-        row("Average alpha",      f"{np.mean(alpha):+.2f}%")
+        row("Average alpha",      f"{st.alpha_mean:+.2f}%")
         row("Beat benchmark",     f"{beat_n} / {len(alpha)} months  ({beat_rate:.1f}%)")
-        row("Max positive alpha", f"{np.max(alpha):+.2f}%")
-        row("Max negative alpha", f"{np.min(alpha):+.2f}%")
+        row("Max positive alpha", f"{st.alpha_max:+.2f}%")
+        row("Max negative alpha", f"{st.alpha_min:+.2f}%")
 
         # stock selection
-        if self.picks is not None:
-            pick_returns = self.picks["Return"].values
+        if self.has_picks:
+            stats        = self._score_return_stats
+            pick_returns = stats.returns
             pick_wr      = (pick_returns > 0).sum() / len(pick_returns) * 100
-            corr         = np.corrcoef(self.picks["Score"].values, pick_returns)[0, 1]
+            corr         = stats.correlation
+
+            if self._stream_picks:
+                total_picks = sum(self._ticker_counter.values())
+                unique      = len(self._ticker_counter)
+            else:
+                total_picks = len(self.picks)
+                unique      = self.picks["Ticker"].nunique()
 
             print()
             print("  Stock Selection")
             print()
-            row("Total picks",          f"{len(self.picks)}")
-            row("Unique stocks",        f"{self.picks['Ticker'].nunique()}")
+            row("Total picks",          f"{total_picks}")
+            row("Unique stocks",        f"{unique}")
             row("Avg pick return",      f"{np.mean(pick_returns):+.2f}%")
             row("Pick win rate",        f"{pick_wr:.1f}%")
             row("Score / return corr",  f"{corr:.3f}")
@@ -374,8 +879,23 @@ class PerformanceAnalyzer:
         print()
         
 
-    def generate_report(self) -> None:
-        """Run all plots and print the statistics summary."""
+    def generate_report(self, force: bool = False, parallel: bool = True,
+                        layout: str = "separate") -> None:
+        """
+            Run all plots and print the statistics summary.
+
+            force=True redraws every PNG even if it is newer than the CSVs.
+            parallel=True (default) renders the six figures in separate
+            processes -- they are fully independent, each worker writes
+            its own PNG, so wall time is the slowest plot instead of the
+            sum of all six. Needs the Agg backend (set at import) so the
+            workers stay headless and fork-safe.
+
+            layout="grid" draws all panels into ONE 3x2 figure saved as
+            performance_report.png -- figure/axes setup is paid once
+            instead of six times (implies serial rendering).
+        """
+        self.force = force
         W = 80
         print()
         print("─" * W)
@@ -383,14 +903,31 @@ class PerformanceAnalyzer:
         print("─" * W)
         print()
 
-        self.plot_cumulative_returns()
-        self.plot_monthly_returns()
-        self.plot_outperformance()
-        self.plot_drawdown()
-
-        if self.picks is not None:
-            self.plot_stock_frequency()
-            self.plot_score_vs_return()
+        methods = ["plot_cumulative_returns", "plot_monthly_returns",
+                   "plot_outperformance", "plot_drawdown"]
+        if self.has_picks:
+            methods += ["plot_stock_frequency", "plot_score_vs_return"]
+
+        if layout == "grid":
+            if force or not self._is_fresh("performance_report.png"):
+                fig, axes = plt.subplots(3, 2, figsize=(24, 18))
+                flat = axes.ravel()
+                for method, panel in zip(methods, flat):
+                    getattr(self, method)(ax=panel)
+                for panel in flat[len(methods):]:
+                    panel.set_visible(False)
+                self._finish(fig, "performance_report.png", save=True)
+        elif parallel:
+            workers = min(len(methods), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_render_plot, m,
+                                       self.results_file, self.picks_file, force)
+                           for m in methods]
+                for f in futures:
+                    f.result()     # re-raise any worker failure here
+        else:
+            for m in methods:
+                getattr(self, m)()
 
         self.print_statistics()
 
@@ -399,6 +936,18 @@ class PerformanceAnalyzer:
         print()
 
 
+def _render_plot(method: str, results_file: str, picks_file: str, force: bool) -> str:
+    """
+        Process-pool worker: build a fresh analyzer in this process and
+        render exactly one figure. Must live at module level so it can
+        be pickled by ProcessPoolExecutor
+    """
+    analyzer = PerformanceAnalyzer(results_file, picks_file)
+    analyzer.force = force
+    getattr(analyzer, method)(save=True)
+    return method
+
+
 if __name__ == "__main__":
     analyzer = PerformanceAnalyzer()
     analyzer.generate_report()
@@ -1,14 +1,29 @@
-import pandas as pd
 import matplotlib.pyplot as plt
 
-df = pd.read_csv("walkforward_results.csv")
+# polars parses the CSV and runs the column math on multithreaded Rust
+# kernels — pandas stays as the fallback so the script runs anywhere
+try:
+    import polars as pl
+except ImportError:
+    pl = None
 
-df["port_cum"] = (1 + df["portfolio"] / 100).cumprod()
-df["nifty_cum"] = (1 + df["nifty"] / 100).cumprod()
+if pl is not None:
+    curves = pl.read_csv("walkforward_results.csv").select(
+        ((1 + pl.col("portfolio") / 100).cum_prod()).alias("port_cum"),
+        ((1 + pl.col("nifty") / 100).cum_prod()).alias("nifty_cum"),
+    )
+    port_cum = curves["port_cum"].to_numpy()
+    nifty_cum = curves["nifty_cum"].to_numpy()
+else:
+    import pandas as pd
+
+    df = pd.read_csv("walkforward_results.csv")
+    port_cum = (1 + df["portfolio"] / 100).cumprod().to_numpy()
+    nifty_cum = (1 + df["nifty"] / 100).cumprod().to_numpy()
 
 plt.figure(figsize=(10, 6))
-plt.plot(df["port_cum"], label="Portfolio")
-plt.plot(df["nifty_cum"], label="Nifty")
+plt.plot(port_cum, label="Portfolio")
+plt.plot(nifty_cum, label="Nifty")
 plt.legend()
 plt.title("Walk-Forward Equity Curve")
 plt.grid(True)
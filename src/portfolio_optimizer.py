@@ -11,64 +11,62 @@ class VolatilityPortfolio:
         self.target_vol = target_vol
 
     def build(self, stocks):
-        rows = []
-        inv_vol_sum = 0.0
-
-        for s in stocks:
-            df = yf.download(
-                s["ticker"],
-                period="60d",
-                progress=False,
-                auto_adjust=True
-            )
-
-            if df.empty or len(df) < 20:
-                continue
-
-            close = df["Close"]
-            if isinstance(close, pd.DataFrame):
-                close = close.iloc[:, 0]
-
-            returns = close.pct_change().dropna()
-
-            # 🔒 FORCE SCALAR
-            vol = float(returns.std() * np.sqrt(252))
+        tickers = [s["ticker"] for s in stocks]
+        scores = np.array([s["score"] for s in stocks], dtype=np.float64)
+
+        # ONE batched download for the whole basket instead of a
+        # request per ticker
+        df = yf.download(
+            tickers,
+            period="60d",
+            group_by="ticker",
+            threads=True,
+            progress=False,
+            auto_adjust=True
+        )
+
+        if df is None or df.empty:
+            print("No valid stocks")
+            return
 
-            if vol <= 0:
+        # one Close column per ticker, NaN where a ticker has no data
+        closes = {}
+        for t in tickers:
+            try:
+                sub = df[t] if isinstance(df.columns, pd.MultiIndex) else df
+            except KeyError:
                 continue
+            closes[t] = sub["Close"]
+        closes = pd.DataFrame(closes)
 
-            edge = float((s["score"] - 50) / 1000)
+        # all the per-stock math as array ops across the basket at once
+        vols = (closes.pct_change().std() * np.sqrt(252)).reindex(tickers).to_numpy()
+        counts = closes.count().reindex(tickers).fillna(0).to_numpy()
 
-            # 🔒 FORCE SCALAR
-            kelly_raw = edge / (vol ** 2)
-            kelly = min(max(kelly_raw, 0.0), 0.25)
-
-            inv_vol = 1.0 / (vol + 0.05)
-            inv_vol_sum += inv_vol
-
-            rows.append({
-                "ticker": s["ticker"],
-                "vol": vol,
-                "edge": edge,
-                "kelly": kelly,
-                "inv_vol": inv_vol
-            })
-
-        if not rows:
+        valid = (counts >= 20) & np.isfinite(vols) & (vols > 0)
+        if not valid.any():
             print("No valid stocks")
             return
 
-        # Base weights
-        for r in rows:
-            r["weight"] = (r["inv_vol"] / inv_vol_sum) * (1 + r["kelly"]) / 2
-
-        # Normalize
-        total_weight = sum(r["weight"] for r in rows)
-        for r in rows:
-            r["weight"] /= total_weight
-            r["weight"] = min(r["weight"], 0.40)
-
-        out = pd.DataFrame(rows)
+        names = np.array(tickers)[valid]
+        vols = vols[valid]
+        edge = (scores[valid] - 50) / 1000
+        kelly = np.clip(edge / vols ** 2, 0.0, 0.25)
+        inv_vol = 1.0 / (vols + 0.05)
+
+        # Base weights, then normalize and cap
+        weight = (inv_vol / inv_vol.sum()) * (1 + kelly) / 2
+        weight /= weight.sum()
+        weight = np.minimum(weight, 0.40)
+
+        out = pd.DataFrame({
+            "ticker": names,
+            "vol": vols,
+            "edge": edge,
+            "kelly": kelly,
+            "inv_vol": inv_vol,
+            "weight": weight,
+        })
         out.to_csv("portfolio_weights.csv", index=False)
 
         print("✓ Saved: portfolio_weights.csv")
@@ -1,33 +1,57 @@
-import pandas as pd
 from pathlib import Path
 
+# polars runs the classify → group_by → mean pipeline without any
+# per-row Python; pandas remains as the fallback path
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
 ROOT = Path(__file__).resolve().parents[1]
 csv_path = ROOT / "walkforward_results.csv"
 
 if not csv_path.exists():
     csv_path = ROOT / "src" / "walkforward_results.csv"
 
-df = pd.read_csv(csv_path)
-
-def regime(n):
-    if n > 2:
-        return "Bull"
-    elif n < -2:
-        return "Bear"
-    else:
-        return "Flat"
-
-df["regime"] = df["nifty"].apply(regime)
-df["edge"] = df["portfolio"] - df["nifty"]
+if pl is not None:
+    summary = (
+        pl.read_csv(csv_path)
+        .with_columns(
+            pl.when(pl.col("nifty") > 2).then(pl.lit("Bull"))
+              .when(pl.col("nifty") < -2).then(pl.lit("Bear"))
+              .otherwise(pl.lit("Flat")).alias("regime"),
+            (pl.col("portfolio") - pl.col("nifty")).alias("edge"),
+        )
+        .group_by("regime")
+        .agg(
+            pl.col("portfolio").mean(),
+            pl.col("nifty").mean(),
+            pl.col("edge").mean(),
+        )
+        .sort("regime")
+    )
+
+    print(summary)
+    summary.write_csv(ROOT / "regime_summary.csv")
+else:
+    import numpy as np
+    import pandas as pd
+
+    df = pd.read_csv(csv_path)
+
+    # one np.select pass classifies every month at once — .apply would
+    # call a Python function per row for the exact same result
+    nifty = df["nifty"].to_numpy()
+    df["regime"] = np.select([nifty > 2, nifty < -2], ["Bull", "Bear"], default="Flat")
+    df["edge"] = df["portfolio"] - df["nifty"]
+
+    summary = df.groupby("regime").agg({
+        "portfolio": "mean",
+        "nifty": "mean",
+        "edge": "mean"
+    })
+
+    print(summary)
+    summary.to_csv(ROOT / "regime_summary.csv")
 
-summary = df.groupby("regime").agg({
-    "portfolio": "mean",
-    "nifty": "mean",
-    "edge": "mean"
-})
-
-print(summary)
-
-summary.to_csv(ROOT / "regime_summary.csv")
 print("✓ Saved: regime_summary.csv")
-
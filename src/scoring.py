@@ -13,7 +13,9 @@
     This is the core decision layer used by the screener and backtest
 """
 
-import pandas as pd
+import math
+
+import numpy as np
 
 class StockScorer:
     """
@@ -104,7 +106,9 @@ class StockScorer:
                 MA50 tells “what is happening now”  
                 MA200 tells “is this real or not”
         """
-        if pd.isna(price) or pd.isna(ma50) or ma50 == 0:
+        # math.isnan: these are plain float scalars, no need for
+        # pandas' generic NA dispatch (NaT / pd.NA / None handling)
+        if math.isnan(price) or math.isnan(ma50) or ma50 == 0:
             return 0.0
 
         diff_pct = (price - ma50) / ma50 * 100
@@ -116,7 +120,7 @@ class StockScorer:
         else:
             base = 0.0
 
-        if ma200 is not None and not pd.isna(ma200) and ma200 > 0:
+        if ma200 is not None and not math.isnan(ma200) and ma200 > 0:
             if base > 0 and ma50 > ma200:
                 """
                     Golden cross structure: price > MA50 > MA200
@@ -167,7 +171,7 @@ class StockScorer:
                 RSI = 35
                 weak / selling pressure → -0.5
         """
-        if pd.isna(rsi14):
+        if math.isnan(rsi14):
             return 0.0
             
         rsi14 = max(0.0, min(100.0, float(rsi14)))
@@ -230,6 +234,51 @@ class StockScorer:
         return round(score, 2)
 
 
+    def calculate_score_batch(self,price: np.ndarray,ma50:  np.ndarray,rsi14: np.ndarray,ma200: np.ndarray = None) -> np.ndarray:
+        """
+            Same rules as calculate_score, but for MANY stocks at once
+
+            Instead of calling the scalar version in a loop (one Python call
+            plus a pile of if/else per stock), every rule becomes one
+            np.where over the whole universe:
+
+                MA band       → +1 above the 1% band, -1 below, 0 inside
+                golden cross  → +0.5 boost (capped at +1)
+                death cross   → -0.5 penalty (capped at -1)
+                RSI           → +1.0 / -0.5 / 0.0 by threshold
+
+            NaNs behave like the scalar version: missing MA50 gives a 0
+            trend signal, missing RSI gives a 0 momentum signal (NaN fails
+            every comparison, which lands on the neutral branch for free).
+
+            Returns the scores rounded to 2 decimals, shaped like the input.
+        """
+        price = np.asarray(price, dtype=np.float64)
+        ma50  = np.asarray(ma50, dtype=np.float64)
+        rsi14 = np.asarray(rsi14, dtype=np.float64)
+
+        valid = ~np.isnan(price) & ~np.isnan(ma50) & (ma50 != 0)
+        safe_ma = np.where(valid, ma50, 1.0) # dodge divide-by-zero/NaN warnings
+        diff_pct = np.where(valid, (price - safe_ma) / safe_ma * 100, 0.0)
+
+        base = np.where(diff_pct > 1, 1.0, np.where(diff_pct < -1, -1.0, 0.0))
+
+        if ma200 is None:
+            ma_sig = base
+        else:
+            ma200 = np.asarray(ma200, dtype=np.float64)
+            has200 = ~np.isnan(ma200) & (ma200 > 0)
+            golden = has200 & (base > 0) & (ma50 > ma200)
+            death  = has200 & (base < 0) & (ma50 < ma200)
+            ma_sig = np.where(golden, np.minimum(base + 0.5, 1.0),
+                     np.where(death,  np.maximum(base - 0.5, -1.0), base))
+
+        rsi_clip = np.clip(rsi14, 0.0, 100.0)
+        rsi_sig = np.where(rsi_clip > 60, 1.0, np.where(rsi_clip < 40, -0.5, 0.0))
+
+        return np.round(self.ma_weight * ma_sig + self.rsi_weight * rsi_sig, 2)
+
+
     @staticmethod
     def is_bullish(price: float,ma50:  float,ma200: float,rsi14: float) -> bool:
         """
@@ -262,7 +311,7 @@ class StockScorer:
                 True  → looks good, worth considering
                 False → ignore it
         """
-        if any(pd.isna(v) for v in [price, ma50, ma200, rsi14]):
+        if any(math.isnan(v) for v in [price, ma50, ma200, rsi14]):
             return False
         """
             If ANY value is missing -> reject this stock
@@ -291,6 +340,22 @@ class StockScorer:
             return "SELL"
 
 
+    def get_interpretation_batch(self, scores: np.ndarray) -> np.ndarray:
+        """
+            get_interpretation for a whole array of scores at once
+
+            np.select checks the thresholds top-down exactly like the
+            if/elif chain above, but in one vectorized pass instead of a
+            Python call per stock. Returns an array of label strings.
+        """
+        scores = np.asarray(scores, dtype=np.float64)
+        return np.select(
+            [scores >= 0.7, scores >= 0.3, scores > -0.3, scores > -0.7],
+            ["STRONG BUY", "BUY", "HOLD", "WEAK SELL"],
+            default="SELL",
+        )
+
+
 if __name__ == "__main__":
     scorer = StockScorer()
 
@@ -340,4 +405,30 @@ if __name__ == "__main__":
     assert StockScorer.is_bullish(500, 480, 490, 55) is False
 
 
+    """
+        batch scoring
+        arrays in, scores out — must agree with the scalar version
+    """
+    batch = scorer.calculate_score_batch(
+        np.array([500.0, 300.0, 400.0, 500.0, 300.0]),
+        np.array([480.0, 310.0, 405.0, 480.0, 310.0]),
+        np.array([65.0,  35.0,  50.0,  65.0,  35.0]),
+        np.array([np.nan, np.nan, np.nan, 450.0, 350.0]),
+    )
+    assert list(batch) == [1.0, -0.7, -0.4, 1.0, -0.7], f"Batch scoring mismatch: {batch}"
+
+    # NaN inputs fall back to neutral signals, like the scalar version
+    batch_nan = scorer.calculate_score_batch(
+        np.array([500.0, 500.0]),
+        np.array([np.nan, 480.0]),
+        np.array([65.0, np.nan]),
+    )
+    assert list(batch_nan) == [0.6, 0.4], f"Batch NaN handling mismatch: {batch_nan}"
+
+    # batch interpretation must agree with the scalar if/elif chain
+    sample = np.array([0.9, 0.5, 0.0, -0.5, -0.9])
+    labels = scorer.get_interpretation_batch(sample)
+    assert list(labels) == [scorer.get_interpretation(s) for s in sample], f"Batch labels mismatch: {labels}"
+
+
     print("✓ All scoring tests pass")
@@ -22,21 +22,14 @@ import argparse
 import warnings
 warnings.filterwarnings("ignore", category=FutureWarning)
 
+import numpy as np
 import pandas as pd
-"""
-    This is for parallel execution
-    
-    Problem without it -
-        download 15 stocks one by one - slow (~30 sec)
-    With this -
-        download multiple stocks at same time - fast (~3–5 sec)
-"""
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 
 import yfinance as yf
 
-from src.indicators import calculate_moving_average, calculate_rsi
+from src._http import SESSION as _SESSION
+from src.indicators import cached_sma, cached_rsi
 from src.scoring    import StockScorer
 from src.stock_list import TEST_TICKERS, NIFTY_50_TICKERS
 
@@ -51,87 +44,102 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# column layout of the per-ticker indicator matrix stored in
+# self.indicators — one (N, 4) float64 block instead of a dict of four
+# separate arrays (fewer objects, and the columns sit together in memory)
+CLOSE, MA50, MA200, RSI14 = 0, 1, 2, 3
+
 
 class StockScreener:
-    def __init__(self,tickers: list,lookback_days: int  = 400,screen_date: datetime = None):
+    def __init__(self,tickers: list,lookback_days: int  = 400,screen_date: datetime = None,verbose: bool = True):
         """
             tickers       - list of stocks
             lookback_days - number of past days to fetch data
             screen_date: date to run the screener (default: today)
+            verbose: per-ticker progress logging (default: True)
+                set False when the screener runs inside a loop
+                (backtest / walk-forward) — a log line per ticker per
+                month is pure I/O overhead there. Warnings and errors
+                always come through.
         """
         self.tickers = tickers
         self.lookback_days = lookback_days
         self.screen_date = screen_date or datetime.now()
+        self.verbose = verbose
         self.data = {}
         self.indicators = {}
+        # filled by calculate_indicators — parallel lists (SoA), one
+        # entry per stock: names here, latest indicator rows there
+        self._tail_tickers = []
+        self._tail_values = [] # each entry is a (4,) row: close, ma50, ma200, rsi
         self.results = None
         self.output_file = "outputs/screener_results.csv"
         self.scorer = StockScorer(ma_weight=0.4, rsi_weight=0.6)
 
 
-    def download_one(self, ticker: str) -> tuple:
+    def download_data(self, max_workers: int = None) -> None:
         """
-            Download price data (OHLCV) for one stock
+            Downloads historical data for ALL tickers in one yf.download call
 
-            Runs inside a thread - each ticker is taken in parallel
-            Returns:
-                (ticker, df) if success
-                (ticker, None) if something fails
+            One multi-ticker request replaces N separate round-trips:
+            yfinance fetches the symbols concurrently server-side and hands
+            back a single frame with one column group per ticker
+            (group_by="ticker"), which we split into self.data
 
-            Why using Ticker().history() instead of download():
-                download() breaks when used with multiple threads
-                All threads end up getting the same stock data
-
-                history() is safer:
-                each ticker gets its own object and request,
-                so parallel calls don’t interfere with each other
-
-            This keeps the data correct while still being fast
+            max_workers still controls yfinance's internal thread pool
+            (default: one thread per ticker, capped at 16)
         """
+        if max_workers is None:
+            max_workers = min(16, max(1, len(self.tickers)))
+
         start_date = self.screen_date - timedelta(days=self.lookback_days)
 
-        try:
-            tk = yf.Ticker(ticker) # yf.download() is NOT thread-safe so we used this
-            df = tk.history(start=start_date.strftime("%Y-%m-%d"),end=self.screen_date.strftime("%Y-%m-%d"))
+        logger.info("─"*71)
+        logger.info("BATCH DOWNLOAD (%d tickers, 1 request)".center(69), len(self.tickers))
+        logger.info("Screen date: %s".center(61), self.screen_date.strftime("%Y-%m-%d"))
+        logger.info("─"*71 + "\n")
 
-            if df.empty:
-                logger.warning("%-20s 🔸  NO DATA returned".center(71), ticker)
-                return ticker, None
+        bulk = yf.download(
+            tickers=list(self.tickers),
+            start=start_date.strftime("%Y-%m-%d"),
+            end=self.screen_date.strftime("%Y-%m-%d"),
+            group_by="ticker",
+            auto_adjust=True,
+            threads=max_workers,
+            progress=False,
+            session=_SESSION, # shared pooled connection (see _http.py)
+        )
+
+        if bulk is None or bulk.empty:
+            logger.error("Batch download returned no data".center(69))
+            return
 
-            logger.info("%-20s 🔹  %d rows downloaded".center(53), ticker, len(df))
-            return ticker, df
+        for ticker in self.tickers:
+            # with ONE ticker yfinance returns a flat frame instead of
+            # a (ticker, field) MultiIndex — handle both shapes
+            if isinstance(bulk.columns, pd.MultiIndex):
+                if ticker not in bulk.columns.get_level_values(0):
+                    logger.warning("%-20s 🔸  NO DATA returned".center(71), ticker)
+                    continue
+                df = bulk[ticker]
+            else:
+                df = bulk
 
-        except Exception as exc:
-            logger.error("%-20s  DOWNLOAD ERROR: %s".center(70), ticker, str(exc)[:60])
-            return ticker, None
+            # canonical shape is fixed HERE, once: flat columns, so no
+            # consumer ever needs an isinstance check on df["Close"]
+            if isinstance(df.columns, pd.MultiIndex):
+                df = df.copy()
+                df.columns = df.columns.get_level_values(0)
 
-    def download_data(self, max_workers: int = 8) -> None:
-        """
-            Downloads historical stock data for all tickers using multiple threads
-            Each ticker is fetched in parallel to reduce total download time
-        """
-        logger.info("─"*71)
-        logger.info("PARALLEL DOWNLOAD (workers=%d)".center(69), max_workers)
-        logger.info("Screen date: %s".center(61), self.screen_date.strftime("%Y-%m-%d"))
-        logger.info("─"*71 + "\n")
+            df = df.dropna(how="all")
+            if df.empty:
+                logger.warning("%-20s 🔸  NO DATA returned".center(71), ticker)
+                continue
 
-        with ThreadPoolExecutor(max_workers=max_workers) as pool:
-            """
-                have 8 workers ready to download stocks
-                Submit all downloads at once
-            """
-            task = {pool.submit(self.download_one, t): t for t in self.tickers}
-            """
-                start downloading this stock
-                What pool.submit does:
-                    runs download_one(ticker) in another thread
-            """
+            if self.verbose:
+                logger.info("%-20s 🔹  %d rows downloaded".center(53), ticker, len(df))
+            self.data[ticker] = df
 
-            for task in as_completed(task): # give me results as soon as each finishes - order = RANDOM (based on which finishes first)
-                ticker, df = task.result() # ("RELIANCE.NS", dataframe)
-                if df is not None:
-                    self.data[ticker] = df
-        
         logger.info("\n")
         logger.info("Downloaded %d / %d Stocks\n".center(70),len(self.data), len(self.tickers))
         
@@ -156,58 +164,71 @@ class StockScreener:
         logger.info("INDICATORS  (MA50, MA200, RSI14)".center(69))
         logger.info("─"*71 + "\n")
 
+        """
+            No per-ticker try/except here anymore: every failure mode has
+            an explicit check below (missing column, empty after cleaning,
+            too little history) and the remaining operations are plain
+            pandas/NumPy calls on already-validated frames. A blanket
+            except Exception would only hide real bugs behind a log line.
+        """
         ok = 0
+        self._tail_tickers = []
+        self._tail_values = []
         for ticker, df in self.data.items():
-            try:
-                """
-                    yf.Ticker().history() always returns a clean DataFrame
-                    with flat column names : Open, High, Low, Close, Volume.
-                    df["Close"] is always a proper pandas Series — no MultiIndex
-                """
-                close = df["Close"]
-
-                # in case some edge-case return a DataFrame
-                if isinstance(close, pd.DataFrame):
-                    close = close.iloc[:, 0] # take all rows first column(0)
-
-                # Ensure we have a clean 1D float Series for all indicators math
-                close = close.squeeze().astype(float).dropna()
-                """
-                    squeeze():
-                        removes extra dimensions
-                    ex:
-                        [[100], [102]] -> [100, 102]
-                        
-                    astype(float):
-                    ensures all values are numbers
-                    ex:
-                        "100" -> 100.0
-                        
-                    dropna():
-                        removes missing values:
-                        [100, NaN, 102] -> [100, 102]
-                """
-                if close.empty:
-                    logger.warning("%-20s  no valid data after cleaning".center(50), ticker)
-                    continue
-                if len(close) < 200:
-                    logger.warning("%-20s  not enough data (<200 rows)".center(40), ticker)
-                    continue
+            if "Close" not in df.columns:
+                logger.warning("%-20s  no Close column in data".center(50), ticker)
+                continue
 
-                ma50  = calculate_moving_average(close, window=50)
-                ma200 = calculate_moving_average(close, window=200)
-                rsi14 = calculate_rsi(close, period=14)
-
-                self.indicators[ticker] = {
-                    "Close": close,
-                    "MA50":  ma50,
-                    "MA200": ma200,
-                    "RSI14": rsi14,
-                }
-                ok += 1
+            # download_data normalized every frame to flat columns, so
+            # df["Close"] is guaranteed to be a 1-D Series here
+            close = df["Close"].astype(float).dropna()
+            """
+                astype(float):
+                ensures all values are numbers
+                ex:
+                    "100" -> 100.0
+
+                dropna():
+                    removes missing values:
+                    [100, NaN, 102] -> [100, 102]
+            """
+            if close.empty:
+                logger.warning("%-20s  no valid data after cleaning".center(50), ticker)
+                continue
+            if len(close) < 200:
+                logger.warning("%-20s  not enough data (<200 rows)".center(40), ticker)
+                continue
 
-            except Exception as exc:
-                logger.error("%-20s  indicator error: %s".center(71), ticker, exc)
+            """
+                leave pandas at this boundary: one contiguous float64
+                array per ticker, and the numba kernels run on it
+                directly — no Series wrapping in the hot path
+                (to_numpy with an explicit dtype already hands back a
+                fresh C-contiguous array, nothing more to do)
+            """
+            arr = close.to_numpy(dtype=np.float64)
+
+            # (ticker, length, last date) pins this exact window, so
+            # re-screening the same date reuses the cached arrays
+            cache_key = (ticker, len(close), close.index[-1])
+
+            ma50  = cached_sma(cache_key, arr, 50)
+            ma200 = cached_sma(cache_key, arr, 200)
+            rsi14 = cached_rsi(cache_key, arr, 14)
+
+            # one (N, 4) matrix per ticker — index columns with the
+            # CLOSE / MA50 / MA200 / RSI14 constants defined up top
+            mat = np.column_stack((arr, ma50, ma200, rsi14))
+            self.indicators[ticker] = mat
+
+            # grab the latest values NOW, while the arrays are hot —
+            # generate_signals then scores straight off these lists
+            # instead of walking self.indicators a second time. mat[-1]
+            # is the whole latest row in one contiguous read, and it goes
+            # into the values list as-is (no per-field tuple packing)
+            self._tail_tickers.append(ticker)
+            self._tail_values.append(mat[-1])
+            ok += 1
 
         logger.info("Indicators ready: %d / %d\n".center(71), ok, len(self.data))
 
@@ -227,71 +248,107 @@ class StockScreener:
             Each stock gets:
                 score   → strength of setup
                 signal  → BUY / SELL etc.
-                bullish → True/False 
+                bullish → True/False
 
             All stocks are sorted by score (best → worst)
+
+            The math runs on NumPy arrays for the WHOLE universe at once
+            (one np.where per rule) instead of calling the scalar scorer
+            ticker by ticker — same scores, no per-stock Python overhead
         """
         logger.info("─"*71)
         logger.info("│" + "SIGNALS & SCORING".center(69) + "│")
         logger.info("─"*71)
 
-        rows = []
+        # latest values were gathered during calculate_indicators
+        # (fused with the indicator pass — no second walk over the dict)
+        tickers = list(self._tail_tickers)
+        tails = self._tail_values
 
-        for ticker, ind in self.indicators.items():
-            try:
-                close = ind["Close"]
-                ma50 = ind["MA50"]
-                ma200 = ind["MA200"]
-                rsi14 = ind["RSI14"]
+        if not tickers:
+            logger.error("No stocks passed screening — check data and indicators".center(60))
+            self.results = pd.DataFrame()
+            return
 
-                price = float(close.iloc[-1])
-                v_ma50 = float(ma50.iloc[-1])
-                v_rsi = float(rsi14.iloc[-1])
-                last_ma200 = ma200.iloc[-1]
-                v_ma200 = float(last_ma200) if not pd.isna(last_ma200) else None
+        tails = np.asarray(tails, dtype=np.float64)
+        price, v_ma50, v_ma200, v_rsi = tails.T
 
-                if pd.isna(v_ma50) or pd.isna(v_rsi):
-                    logger.warning("%-20s  skipped — MA50 or RSI not ready".center(50), ticker)
-                    continue
+        ready = ~np.isnan(v_ma50) & ~np.isnan(v_rsi)
+        for ticker, ok in zip(tickers, ready):
+            if not ok:
+                logger.warning("%-20s  skipped — MA50 or RSI not ready".center(50), ticker)
 
-                score = self.scorer.calculate_score(price, v_ma50, v_rsi, v_ma200)
-                signal = self.scorer.get_interpretation(score)
-                ma_diff = round((price - v_ma50) / v_ma50 * 100, 2)
-
-                if v_ma200 is not None:
-                    bullish = StockScorer.is_bullish(price, v_ma50, v_ma200, v_rsi)
-                else:
-                    bullish = False # cant confirm without MA200
-
-                rows.append({
-                    "Ticker":         ticker,
-                    "Price":          round(price, 2),
-                    "MA50":           round(v_ma50, 2),
-                    "MA200":          round(v_ma200, 2) if v_ma200 else None,
-                    "MA_Diff_%":      ma_diff,
-                    "RSI14":          round(v_rsi, 2),
-                    "Bullish":        bullish,
-                    "Combined_Score": score,
-                    "Signal":         signal
-                })
-
-                logger.info("│" + "%-16s  Score = %+.2f    %-12s  Bullish = %-6s".center(49) + "│",ticker, score, signal, bullish)
-
-            except Exception as exc:
-                logger.error("%-20s  signal error: %s".center(71), ticker, exc)
-
-        if not rows:
+        tickers = [t for t, ok in zip(tickers, ready) if ok]
+        price, v_ma50, v_ma200, v_rsi = (a[ready] for a in (price, v_ma50, v_ma200, v_rsi))
+
+        if not tickers:
             logger.error("No stocks passed screening — check data and indicators".center(60))
             self.results = pd.DataFrame()
             return
-            
-        self.results = pd.DataFrame(rows).sort_values("Combined_Score", ascending=False).reset_index(drop=True)
+
+        # scoring rules live in StockScorer — this is the batch version
+        ma_diff = (price - v_ma50) / v_ma50 * 100
+        scores = self.scorer.calculate_score_batch(price, v_ma50, v_rsi, v_ma200)
+
+        has200 = ~np.isnan(v_ma200) & (v_ma200 > 0)
+        bullish = has200 & (price > v_ma50) & (v_ma50 > v_ma200) & (v_rsi > 40) & (v_rsi < 70)
+        signals = self.scorer.get_interpretation_batch(scores)
+
+        if self.verbose:
+            for ticker, score, signal, bull in zip(tickers, scores, signals, bullish):
+                logger.info("│" + "%-16s  Score = %+.2f    %-12s  Bullish = %-6s".center(49) + "│",ticker, score, signal, bool(bull))
+
+        # unsorted arrays kept around so top_picks() can select the best N
+        # without touching the sorted table below
+        self._tickers = tickers
+        self._scores = scores
+        self._prices = price
+        self._signals = signals
+
+        # full precision kept here — display rounding happens once, in
+        # export_results, as a single DataFrame.round pass
+        self.results = pd.DataFrame({
+            "Ticker":         tickers,
+            "Price":          price,
+            "MA50":           v_ma50,
+            "MA200":          np.where(has200, v_ma200, np.nan),
+            "MA_Diff_%":      ma_diff,
+            "RSI14":          v_rsi,
+            "Bullish":        bullish,
+            "Combined_Score": scores,
+            "Signal":         signals,
+        }).sort_values("Combined_Score", ascending=False).reset_index(drop=True)
         self.results["Rank"] = self.results.index + 1
-        
+
         logger.info("─"*71 + '\n')
         logger.info("Scored %d stocks\n".center(71), len(self.results))
 
 
+    def top_picks(self, n: int) -> list:
+        """
+            Return the best n stocks as (ticker, score, price, signal) tuples
+
+            Sorting the whole universe just to keep the top 3 is wasted work
+            (N log N). np.argpartition finds the top n in one O(N) pass and
+            we only sort those n for presentation order.
+
+            The full ranked table (self.results) still exists for the CSV
+            export — this is the fast path for the backtest / walk-forward.
+        """
+        if self.results is None or self.results.empty or n <= 0:
+            return []
+
+        scores = self._scores
+        n = min(n, len(scores))
+
+        if n == len(scores):
+            idx = np.argsort(-scores)
+        else:
+            idx = np.argpartition(-scores, n - 1)[:n]
+            idx = idx[np.argsort(-scores[idx])] # order just the winners
+        return [(self._tickers[i], float(scores[i]), round(float(self._prices[i]), 2), self._signals[i]) for i in idx]
+
+
     def export_results(self, top_n: int = 5) -> None:
         """
             Save results to CSV and print top N stocks to terminal.
@@ -304,18 +361,39 @@ class StockScreener:
             logger.error("No results to export")
             return
 
+        # one vectorized rounding pass over the whole table, instead of
+        # a Python-level round() per field per ticker during scoring
+        self.results = self.results.round({
+            "Price": 2, "MA50": 2, "MA200": 2, "MA_Diff_%": 2, "RSI14": 2,
+        })
+
         self.results.to_csv(self.output_file, index=False)
         logger.info("Saved -> %s".center(42), self.output_file)
 
+        # columnar twin of the CSV: typed, compressed, and much faster
+        # to read back than re-parsing text. CSV stays for anything that
+        # expects it; parquet needs pyarrow, so it's best-effort
+        try:
+            parquet_file = self.output_file.rsplit(".", 1)[0] + ".parquet"
+            self.results.to_parquet(parquet_file, index=False)
+            logger.info("Saved -> %s".center(42), parquet_file)
+        except Exception:
+            pass
+
         display_cols = [
             "Rank", "Ticker", "Price", "MA50", "MA200",
             "RSI14", "Combined_Score", "Signal", "Bullish"
         ]
+        # nlargest picks the preview rows by score directly, so the
+        # terminal output stays correct even if the frame's sort order
+        # ever changes upstream
+        preview = self.results.nlargest(top_n, "Combined_Score")
+
         print("\n" + "─"*98)
         print(f"  TOP {top_n} STOCKS  "f"[screened on {self.screen_date.strftime('%Y-%m-%d')}]".center(98, "─"))
         print("─"*98)
         print("")
-        print(self.results[display_cols].head(top_n).to_string(index=False))
+        print(preview[display_cols].to_string(index=False))
         print("")
         print("─"*98 + "\n")
 
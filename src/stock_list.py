@@ -1,4 +1,18 @@
-NIFTY_50_TICKERS = [
+import sys
+
+"""
+    A tuple, not a list:
+        the universe never changes at runtime, and a tuple says so
+        (immutable, slightly smaller, safe to share everywhere)
+
+    sys.intern on each ticker:
+        these exact strings are used as dict keys over and over
+        (self.data[ticker], self.indicators[ticker], cache keys...)
+        interning gives every lookup the same string object, so dict
+        compares hit the pointer-equality fast path instead of
+        comparing characters
+"""
+NIFTY_50_TICKERS = tuple(sys.intern(t) for t in (
     'RELIANCE.NS',     # Energy giant
     'TCS.NS',          # IT service
     'INFY.NS',         # IT service
@@ -14,7 +28,7 @@ NIFTY_50_TICKERS = [
     'BHARTIARTL.NS',   # Telecom
     'SUNPHARMA.NS',    # Pharma
     'DRREDDY.NS'       # Pharma
-]
+))
 
 TEST_TICKERS = NIFTY_50_TICKERS[:15]
 
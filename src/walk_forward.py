@@ -23,13 +23,17 @@ import warnings
 warnings.filterwarnings("ignore", category=FutureWarning)
 
 import logging
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
+from functools import lru_cache
 from dateutil.relativedelta import relativedelta
 import yfinance as yf
 
+from src._http      import SESSION as _SESSION
 from src.screener   import StockScreener
 from src.stock_list import get_stock_list
 
@@ -47,6 +51,20 @@ INDIA_RF_ANNUAL = 0.07
 RF_MONTHLY      = INDIA_RF_ANNUAL / 12   # ~0.00583
 
 
+@lru_cache(maxsize=64)
+def _download_nifty(start_str: str, end_str: str) -> pd.DataFrame:
+    """
+        Benchmark fallback for runs without a preloaded universe
+        (get_nifty_return called standalone): each distinct ^NSEI window
+        is fetched once per session and memoized, so repeated calls for
+        the same month never reach the network twice
+    """
+    df = yf.download("^NSEI",start=start_str,end=end_str,progress=False,auto_adjust=True,session=_SESSION)
+    if isinstance(df.columns, pd.MultiIndex):
+        df.columns = df.columns.get_level_values(0)
+    return df
+
+
 class WalkForwardValidator:
     def __init__(self,warmup_months: int = 6,holding_period: int = 1,top_n: int = 3,slippage_pct: float = 0.2):
         """
@@ -72,6 +90,8 @@ class WalkForwardValidator:
         self.stock_list = get_stock_list()
         self.results = []
         self.all_picks = []
+        self.universe_data = {} # full-span frames, filled by preload_history()
+        self._total_test_months = 0 # set by run(), read by process_month headers
 
         logger.info("─"*71)
         logger.info("│" + "WALK-FORWARD VALIDATOR".center(69) + "│")
@@ -84,6 +104,70 @@ class WalkForwardValidator:
         logger.info("─"*71 + "\n")
         
 
+    def preload_history(self, start: datetime, months: int) -> None:
+        """
+            Download every month's data in ONE request, before the loop
+
+            Each test month used to re-download ~400 days of history per
+            ticker plus ^NSEI, even though consecutive months overlap
+            almost completely. One batched download covering
+                [first screen date - 400d ... last exit date]
+            means the monthly loop never touches the network — blindness
+            is preserved because screen_blind only SLICES up to
+            screen_date, exactly what the per-month download returned.
+        """
+        global_start = start - timedelta(days=400)
+        global_end = start + relativedelta(months=months) + timedelta(days=self.holding_days + 10)
+
+        tickers = list(self.stock_list) + ["^NSEI"]
+        logger.info("Preloading %d tickers  %s → %s".center(69),len(tickers),global_start.strftime("%Y-%m-%d"),global_end.strftime("%Y-%m-%d"))
+
+        bulk = yf.download(
+            tickers=tickers,
+            start=global_start.strftime("%Y-%m-%d"),
+            end=global_end.strftime("%Y-%m-%d"),
+            group_by="ticker",
+            auto_adjust=True,
+            threads=True,
+            progress=False,
+            session=_SESSION, # shared pooled connection (see _http.py)
+        )
+
+        if bulk is None or bulk.empty:
+            logger.warning("Preload returned no data -- falling back to per-month downloads".center(71))
+            return
+
+        for ticker in tickers:
+            if isinstance(bulk.columns, pd.MultiIndex):
+                if ticker not in bulk.columns.get_level_values(0):
+                    continue
+                df = bulk[ticker]
+            else:
+                df = bulk
+            # flatten any leftover column levels at ingestion — every
+            # consumer downstream can then index df["Close"] blindly
+            if isinstance(df.columns, pd.MultiIndex):
+                df = df.copy()
+                df.columns = df.columns.get_level_values(0)
+            df = df.dropna(how="all")
+            if not df.empty:
+                self.universe_data[ticker] = df
+
+        logger.info("Preloaded %d / %d tickers\n".center(70), len(self.universe_data), len(tickers))
+
+    @staticmethod
+    def slice_window(df: pd.DataFrame, start: datetime, end: datetime) -> pd.DataFrame:
+        """
+            Rows with start <= date < end — end exclusive, same contract as
+            yf.download's start/end, so slicing can never leak future rows
+        """
+        s = pd.Timestamp(start)
+        e = pd.Timestamp(end)
+        if df.index.tz is not None:
+            s = s.tz_localize(df.index.tz)
+            e = e.tz_localize(df.index.tz)
+        return df[(df.index >= s) & (df.index < e)]
+
     def screen_blind(self, screen_date: datetime) -> list:
         """
             Run the screener on screen_date using only data available up to that date
@@ -103,24 +187,41 @@ class WalkForwardValidator:
         logger.info("│" + text.center(69) + "│")
         logger.info("─"*71 + "\n")
 
-        screener = StockScreener(tickers = self.stock_list,lookback_days = 400,screen_date = screen_date)
-        screener.download_data(max_workers=6)
+        screener = StockScreener(tickers = self.stock_list,lookback_days = 400,screen_date = screen_date,verbose = False)
+
+        if self.universe_data:
+            # preloaded run: hand the screener in-memory blind slices
+            # (history up to screen_date only) instead of downloading
+            lookback_start = screen_date - timedelta(days=400)
+            for ticker in self.stock_list:
+                full = self.universe_data.get(ticker)
+                if full is None:
+                    continue
+                window = self.slice_window(full, lookback_start, screen_date)
+                if not window.empty:
+                    screener.data[ticker] = window
+        else:
+            screener.download_data(max_workers=6)
+
         screener.calculate_indicators()
         screener.generate_signals()
 
-        if screener.results is None or screener.results.empty:
+        # top_picks runs on the screener's raw score arrays — an O(N)
+        # argpartition instead of reading the sorted table row by row
+        top = screener.top_picks(self.top_n)
+
+        if not top:
             logger.warning("No picks generated for %s".center(69), screen_date.strftime("%b %Y"))
             return []
 
-        top = screener.results.head(self.top_n)
-        picks = [(row["Ticker"], row["Combined_Score"], row["Price"])for _, row in top.iterrows()]
+        picks = [(ticker, score, price) for ticker, score, price, _ in top]
 
         logger.info("─"*77)
         logger.info("│" + "TOP PICKS".center(75) + "│")
         logger.info("─"*77)
 
-        for _, row in top.iterrows():
-            line = f"{row['Ticker']:<20} - {row['Signal']:>12}"
+        for ticker, _, _, signal in top:
+            line = f"{ticker:<20} - {signal:>12}"
             logger.info("│" + line.center(75) + "│")
 
         logger.info("─"*77)
@@ -156,48 +257,75 @@ class WalkForwardValidator:
         logger.info("│"+ "TRADES".center(75) + "│")
         logger.info("─"*77)
 
+        frames = {}
+        if self.universe_data:
+            # preloaded run: forward windows are already in memory
+            for ticker, _, _ in picks:
+                full = self.universe_data.get(ticker)
+                if full is not None:
+                    frames[ticker] = self.slice_window(full, screen_date, exit_date)
+        else:
+            # ONE request for every pick's forward window instead of a
+            # sequential HTTP round-trip per stock — yfinance splits a
+            # multi-ticker call into (ticker, field) column groups for us
+            tickers = [t for t, _, _ in picks]
+            bulk = yf.download(
+                tickers=tickers,
+                start=screen_date.strftime("%Y-%m-%d"),
+                end=exit_date.strftime("%Y-%m-%d"),
+                group_by="ticker",
+                auto_adjust=True,
+                progress=False,
+                session=_SESSION,
+            )
+            if bulk is not None and not bulk.empty:
+                if isinstance(bulk.columns, pd.MultiIndex):
+                    for ticker in tickers:
+                        if ticker in bulk.columns.get_level_values(0):
+                            frames[ticker] = bulk[ticker]
+                else:
+                    frames[tickers[0]] = bulk  # single pick -> flat frame
+
+        # every failure mode is an explicit check now (no frame, no Close
+        # column, too few rows, zero entry) — the old per-pick
+        # except Exception only had network errors left to catch, and
+        # those happen in the download above, not here
         for ticker, score, entry_price in picks:
-            try:
-                tk = yf.Ticker(ticker)
-                df = tk.history(start = screen_date.strftime("%Y-%m-%d"),end = exit_date.strftime("%Y-%m-%d"))
-
-                if df.empty or len(df) < 2:
-                    logger.warning("%-20s  not enough forward data".center(69), ticker)
-                    continue
-
-                close = df["Close"]
-                if isinstance(close, pd.DataFrame):
-                    close = close.iloc[:, 0]
-                close = close.dropna()
+            df = frames.get(ticker)
+            if df is None or df.empty or len(df) < 2 or "Close" not in df.columns:
+                logger.warning("%-20s  not enough forward data".center(69), ticker)
+                continue
 
-                if len(close) < 2:
-                    continue
+            # frames were normalized to flat columns at ingestion, so
+            # df["Close"] is a plain Series. The ndarray conversion means
+            # [0]/[-1] skip pandas' label-lookup machinery
+            close = df["Close"].dropna().to_numpy()
 
-                entry = float(close.iloc[0])
-                exit = float(close.iloc[-1])
+            if len(close) < 2:
+                continue
 
-                if entry == 0:
-                    continue
+            entry = float(close[0])
+            exit = float(close[-1])
 
-                gross_ret = (exit - entry) / entry * 100
-                net_ret = gross_ret - self.slippage_pct  # FIX: deduct round-trip slippage
+            if entry == 0:
+                continue
 
-                trades.append({
-                    "Ticker":       ticker,
-                    "Score":        score,
-                    "Entry_Price":  round(entry, 2),
-                    "Exit_Price":   round(exit, 2),
-                    "Gross_Return": round(gross_ret, 2),
-                    "Return":       round(net_ret, 2)
-                })
+            gross_ret = (exit - entry) / entry * 100
+            net_ret = gross_ret - self.slippage_pct  # FIX: deduct round-trip slippage
 
-                line = (
-                    f"{ticker:<12} │ {entry:>8.2f} │ {exit:>8.2f}"
-                    f" │ profit = {gross_ret:+6.2f}% │ net_pft = {net_ret:+6.2f}%")
-                logger.info("│ " + line.ljust(73) + " │")
+            trades.append({
+                "Ticker":       ticker,
+                "Score":        score,
+                "Entry_Price":  round(entry, 2),
+                "Exit_Price":   round(exit, 2),
+                "Gross_Return": round(gross_ret, 2),
+                "Return":       round(net_ret, 2)
+            })
 
-            except Exception as exc:
-                logger.warning("%-20s  return calc failed: %s".center(60), ticker, exc)
+            line = (
+                f"{ticker:<12} │ {entry:>8.2f} │ {exit:>8.2f}"
+                f" │ profit = {gross_ret:+6.2f}% │ net_pft = {net_ret:+6.2f}%")
+            logger.info("│ " + line.ljust(73) + " │")
 
         logger.info("─"*77)
 
@@ -223,17 +351,21 @@ class WalkForwardValidator:
                 strategy -2% vs Nifty -5% -> good (lost less)
         """
         try:
-            tk = yf.Ticker("^NSEI")
-            df = tk.history(start = start.strftime("%Y-%m-%d"),end = end.strftime("%Y-%m-%d"))
+            nsei = self.universe_data.get("^NSEI")
+            if nsei is not None:
+                # preloaded run: the benchmark is already in memory
+                df = self.slice_window(nsei, start, end)
+            else:
+                df = _download_nifty(start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"))
 
             if len(df) < 2:
                 return 0.0
 
-            close = df["Close"]
-            if isinstance(close, pd.DataFrame):
-                close = close.iloc[:, 0]
+            close = df["Close"].dropna().to_numpy()
+            if len(close) < 2 or close[0] == 0:
+                return 0.0
 
-            return float((close.iloc[-1] - close.iloc[0]) / close.iloc[0] * 100)
+            return float((close[-1] - close[0]) / close[0] * 100)
 
         except Exception:
             return 0.0
@@ -273,6 +405,14 @@ class WalkForwardValidator:
         results_df.to_csv("outputs/walk_forward_results.csv", index=False)
         picks_df.to_csv("outputs/walk_forward_picks.csv", index=False)
 
+        # parquet alongside the CSVs — typed + compressed, so anything
+        # reading the results back skips text parsing (needs pyarrow)
+        try:
+            results_df.to_parquet("outputs/walk_forward_results.parquet", index=False)
+            picks_df.to_parquet("outputs/walk_forward_picks.parquet", index=False)
+        except Exception:
+            pass
+
         print("")
         logger.info("Saved -> walk_forward_results.csv".center(69))
         logger.info("Saved -> walk_forward_picks.csv".center(68))
@@ -336,7 +476,7 @@ class WalkForwardValidator:
         return results_df
 
 
-    def run(self, start_year: int = 2024, months: int = 12) -> pd.DataFrame:
+    def run(self, start_year: int = 2024, months: int = 12, parallel: bool = True) -> pd.DataFrame:
         """
             Run walk-forward validation month by month
             Skips first warmup_months so MA200 has enough history before first test
@@ -347,6 +487,10 @@ class WalkForwardValidator:
                 ...
                 Dec 2024     -> last test  (6 test months total)
 
+            parallel=True runs the test months on separate processes
+            (they are independent once history is preloaded); pass False
+            to debug with everything on one core
+
             Returns dataframe and saves CSVs
         """
         start = datetime(start_year, 1, 15)
@@ -362,53 +506,91 @@ class WalkForwardValidator:
                 "months left Increase months or reduce warmup_months",self.warmup_months, months)
             return pd.DataFrame()
 
-        for i in range(self.warmup_months, months):
-            screen_date = start + relativedelta(months=i)
-            month_str   = screen_date.strftime("%b %Y")
-            month_num   = i - self.warmup_months + 1
+        self.preload_history(start, months)
+
+        # all the calendar arithmetic happens here, once — the loop body
+        # below just walks a prebuilt list of dates
+        screen_dates = [start + relativedelta(months=i) for i in range(self.warmup_months, months)]
+        self._total_test_months = total_test_months
+
+        if parallel and len(screen_dates) > 1:
+            """
+                Months are independent once the history is preloaded
+                (each one slices its own window, no shared state is
+                written), so they can run on separate cores.
+
+                pool.map returns outcomes IN SUBMISSION ORDER no matter
+                which worker finishes first — the results table stays
+                chronological.
+            """
+            workers = min(os.cpu_count() or 1, len(screen_dates))
+            logger.info("Processing %d months on %d processes".center(69),len(screen_dates), workers)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                outcomes = list(pool.map(self.process_month, enumerate(screen_dates, start=1)))
+        else:
+            outcomes = [self.process_month(item) for item in enumerate(screen_dates, start=1)]
+
+        for outcome in outcomes:
+            if outcome is None:
+                continue
+            self.results.append(outcome["result"])
+            self.all_picks.extend(outcome["trades"])
 
-            print("")
-            logger.info("─"*71)
-            text = f"Month {month_num} / {total_test_months} -- {month_str}"
-            logger.info("│" + text.center(69) + "│")
+        return self.save_and_print()
 
-            picks = self.screen_blind(screen_date)
-            if not picks:
-                logger.warning("Skipping %s -- no picks".center(69), month_str)
-                continue
+    def process_month(self, item: tuple) -> dict:
+        """
+            Screen, trade and benchmark ONE walk-forward month
 
-            port_return, nifty_return, trades = self.measure_returns(picks, screen_date)
+            Self-contained so it can run either inline (serial mode) or
+            in a worker process. Returns {"result": ..., "trades": [...]}
+            or None when the month produced nothing tradeable.
+        """
+        month_num, screen_date = item
+        month_str = screen_date.strftime("%b %Y")
 
-            if not trades:
-                logger.warning("Skipping %s -- all trades failed (no forward data)".center(69), month_str)
-                continue
+        print("")
+        logger.info("─"*71)
+        text = f"Month {month_num} / {self._total_test_months} -- {month_str}"
+        logger.info("│" + text.center(69) + "│")
 
-            self.results.append({
-                "Month":            month_str,
-                "Portfolio_Return": round(port_return,  2),
-                "Nifty_Return":     round(nifty_return, 2),
-                "Outperformance":   round(port_return - nifty_return, 2),
-                "Num_Stocks":       len(trades),
-            })
+        picks = self.screen_blind(screen_date)
+        if not picks:
+            logger.warning("Skipping %s -- no picks".center(69), month_str)
+            return None
 
-            for t in trades:
-                t["Month"] = month_str
-                self.all_picks.append(t)
+        port_return, nifty_return, trades = self.measure_returns(picks, screen_date)
 
-            logger.info("│" + "PERFORMANCE".center(75) + "│")
-            logger.info("─"*77)
+        if not trades:
+            logger.warning("Skipping %s -- all trades failed (no forward data)".center(69), month_str)
+            return None
 
-            line1 = f"{'Portfolio (net)':<18} - {port_return:+8.2f}%"
-            line2 = f"{'Nifty':<18} - {nifty_return:+8.2f}%"
-            line3 = f"{'Alpha':<18} - {(port_return - nifty_return):+8.2f}%"
+        for t in trades:
+            t["Month"] = month_str
 
-            logger.info("│" + line1.center(75) + "│")
-            logger.info("│" + line2.center(75) + "│")
-            logger.info("│" + line3.center(75) + "│")
+        logger.info("│" + "PERFORMANCE".center(75) + "│")
+        logger.info("─"*77)
 
-            logger.info("─"*77)
+        line1 = f"{'Portfolio (net)':<18} - {port_return:+8.2f}%"
+        line2 = f"{'Nifty':<18} - {nifty_return:+8.2f}%"
+        line3 = f"{'Alpha':<18} - {(port_return - nifty_return):+8.2f}%"
 
-        return self.save_and_print()
+        logger.info("│" + line1.center(75) + "│")
+        logger.info("│" + line2.center(75) + "│")
+        logger.info("│" + line3.center(75) + "│")
+
+        logger.info("─"*77)
+
+        return {
+            "result": {
+                "Month":            month_str,
+                "Portfolio_Return": round(port_return,  2),
+                "Nifty_Return":     round(nifty_return, 2),
+                "Outperformance":   round(port_return - nifty_return, 2),
+                "Num_Stocks":       len(trades),
+            },
+            "trades": trades,
+        }
 
 
 if __name__ == "__main__":
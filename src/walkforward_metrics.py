@@ -1,26 +1,59 @@
-import pandas as pd
 import numpy as np
+from pathlib import Path
 
-df = pd.read_csv("walkforward_results.csv")
+# pyarrow reads the results straight into Arrow buffers (C++ CSV/parquet
+# readers, no Python-level parsing) and writes the output the same way —
+# the pandas path below stays as the fallback
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as papq
+except ImportError:
+    pa = None
 
-# Basic metrics
-portfolio = df["portfolio"]
-nifty = df["nifty"]
+pq_path = Path("walkforward_results.parquet")
+
+if pa is not None:
+    if pq_path.exists():
+        table = papq.read_table(pq_path)
+    else:
+        table = pacsv.read_csv("walkforward_results.csv")
+
+    portfolio = table["portfolio"].to_numpy(zero_copy_only=False)
+    nifty = table["nifty"].to_numpy(zero_copy_only=False)
+else:
+    import pandas as pd
+
+    if pq_path.exists():
+        df = pd.read_parquet(pq_path)
+    else:
+        df = pd.read_csv("walkforward_results.csv")
+
+    portfolio = df["portfolio"].to_numpy()
+    nifty = df["nifty"].to_numpy()
+
+# the seven stats are one NumPy reduction each — ddof=1 matches the
+# sample std that pandas' .std() used before
+portfolio_std = portfolio.std(ddof=1) if len(portfolio) > 1 else 0.0
 
 metrics = {
     "portfolio_mean": portfolio.mean(),
-    "portfolio_std": portfolio.std(),
-    "portfolio_sharpe": portfolio.mean() / portfolio.std() if portfolio.std() != 0 else 0,
+    "portfolio_std": portfolio_std,
+    "portfolio_sharpe": portfolio.mean() / portfolio_std if portfolio_std != 0 else 0,
     "nifty_mean": nifty.mean(),
-    "nifty_std": nifty.std(),
+    "nifty_std": nifty.std(ddof=1) if len(nifty) > 1 else 0.0,
     "win_rate": (portfolio > nifty).mean(),
     "avg_edge": (portfolio - nifty).mean(),
     "total_edge": (portfolio - nifty).sum(),
 }
 
-out = pd.DataFrame(metrics, index=[0])
-out.to_csv("walkforward_metrics.csv", index=False)
+if pa is not None:
+    out = pa.table({k: [float(v)] for k, v in metrics.items()})
+    pacsv.write_csv(out, "walkforward_metrics.csv")
+else:
+    out = pd.DataFrame(metrics, index=[0])
+    out.to_csv("walkforward_metrics.csv", index=False)
 
 print("✓ Saved: walkforward_metrics.csv")
-print(out.to_string(index=False))
-
+for name, value in metrics.items():
+    print(f"{name:>18}: {float(value):.4f}")